@@ -18,10 +18,17 @@ class TransportAdapter(Protocol):
     (proxy acts as server) and one server-facing (proxy acts as client).
 
     The pipeline calls read() to receive the next message from one side
-    and write() to send it to the other side. close() shuts down the
+    and write() to send it to the other side. read_many() and write_many()
+    move bursts of messages in a single call. close() shuts down the
     transport connection.
+
+    This is a static-typing contract only. It is deliberately not
+    ``runtime_checkable`` and adapters do not inherit from it, so nothing
+    pays for ``isinstance`` protocol checks at runtime.
     """
 
+    __slots__ = ()
+
     async def read(self) -> SessionMessage:
         """Read the next message from this side of the connection.
 
@@ -44,6 +51,34 @@ class TransportAdapter(Protocol):
         """
         ...
 
+    async def read_many(self, max_items: int = 32) -> list[SessionMessage]:
+        """Read the next message plus any others already available.
+
+        Waits for at least one message, then collects up to ``max_items``
+        messages that can be taken without waiting.
+
+        Args:
+            max_items: Upper bound on the number of messages returned.
+
+        Returns:
+            A non-empty list of SessionMessages in arrival order.
+
+        Raises:
+            Exception: If the connection is closed or broken.
+        """
+        ...
+
+    async def write_many(self, messages: list[SessionMessage]) -> None:
+        """Write several messages to this side of the connection, in order.
+
+        Args:
+            messages: The SessionMessages to send over the transport.
+
+        Raises:
+            Exception: If the connection is closed or broken.
+        """
+        ...
+
     async def close(self) -> None:
         """Shut down this side of the connection.
 
@@ -1,8 +1,9 @@
 """stdio transport adapters for mcp-proxy.
 
-Provides server-facing and client-facing adapters that bridge MCP SDK
-anyio streams to asyncio queues. The pipeline never sees anyio — only
-these adapters touch SDK transport internals.
+Provides server-facing and client-facing adapters that wrap the MCP SDK
+anyio memory streams behind the asyncio ``TransportAdapter`` interface.
+The pipeline never sees anyio — only these adapters touch SDK transport
+internals.
 
 StdioServerAdapter wraps ``stdio_client()`` — spawns the target MCP server.
 StdioClientAdapter wraps ``stdio_server()`` — the proxy IS the subprocess.
@@ -10,11 +11,12 @@ StdioClientAdapter wraps ``stdio_server()`` — the proxy IS the subprocess.
 
 from __future__ import annotations
 
-import asyncio
-import contextlib
 import logging
+from contextlib import AbstractAsyncContextManager
 from types import TracebackType
+from typing import Any
 
+import anyio
 from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 from mcp.client.stdio import StdioServerParameters, stdio_client
 from mcp.server.stdio import stdio_server
@@ -22,16 +24,13 @@ from mcp.shared.message import SessionMessage
 
 logger = logging.getLogger(__name__)
 
-# Sentinel pushed into the read queue when the SDK stream ends
-_STREAM_CLOSED = object()
-
 
 class StdioServerAdapter:
     """Server-facing adapter — proxy connects to a real MCP server via stdio.
 
     Wraps the MCP SDK ``stdio_client()`` context manager. Spawns the target
-    server as a subprocess and bridges its anyio streams to asyncio queues
-    for consumption by the pipeline.
+    server as a subprocess and reads from / writes to its anyio streams
+    on behalf of the pipeline.
 
     Args:
         command: Executable to run as the MCP server.
@@ -58,24 +57,17 @@ class StdioServerAdapter:
             env=env,
             cwd=cwd,
         )
-        self._read_queue: asyncio.Queue[SessionMessage | object] = asyncio.Queue()
-        self._write_queue: asyncio.Queue[SessionMessage] = asyncio.Queue()
         self._closed = False
-        self._reader_task: asyncio.Task[None] | None = None
-        self._writer_task: asyncio.Task[None] | None = None
+        self._sdk_cm: AbstractAsyncContextManager[Any] | None = None
+        self._read_stream: MemoryObjectReceiveStream[SessionMessage | Exception] | None = None
+        self._write_stream: MemoryObjectSendStream[SessionMessage] | None = None
 
     async def __aenter__(self) -> StdioServerAdapter:
-        """Enter the adapter context — start SDK transport and bridge tasks."""
+        """Enter the adapter context — start the SDK transport."""
         self._sdk_cm = stdio_client(self._server_params)
         read_stream, write_stream = await self._sdk_cm.__aenter__()
-        self._reader_task = asyncio.create_task(
-            self._reader_loop(read_stream),
-            name="stdio-server-reader",
-        )
-        self._writer_task = asyncio.create_task(
-            self._writer_loop(write_stream),
-            name="stdio-server-writer",
-        )
+        self._read_stream = read_stream
+        self._write_stream = write_stream
         return self
 
     async def __aexit__(
@@ -84,9 +76,9 @@ class StdioServerAdapter:
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
-        """Exit the adapter context — clean up tasks and SDK transport."""
+        """Exit the adapter context — close and shut down the SDK transport."""
         await self.close()
-        if hasattr(self, "_sdk_cm"):
+        if self._sdk_cm is not None:
             try:
                 await self._sdk_cm.__aexit__(exc_type, exc_val, exc_tb)
             except Exception:
@@ -101,12 +93,17 @@ class StdioServerAdapter:
         Raises:
             RuntimeError: If the adapter has been closed.
         """
-        if self._closed:
-            raise RuntimeError("StdioServerAdapter is closed")
-        item = await self._read_queue.get()
-        if item is _STREAM_CLOSED:
+        if self._closed or self._read_stream is None:
             raise RuntimeError("StdioServerAdapter is closed")
-        return item  # type: ignore[return-value]
+        while True:
+            try:
+                item = await self._read_stream.receive()
+            except (anyio.EndOfStream, anyio.ClosedResourceError) as exc:
+                raise RuntimeError("StdioServerAdapter is closed") from exc
+            if isinstance(item, Exception):
+                logger.warning("Exception from server stream: %s", item)
+                continue
+            return item
 
     async def write(self, message: SessionMessage) -> None:
         """Write a message to the server.
@@ -117,69 +114,63 @@ class StdioServerAdapter:
         Raises:
             RuntimeError: If the adapter has been closed.
         """
-        if self._closed:
+        if self._closed or self._write_stream is None:
             raise RuntimeError("StdioServerAdapter is closed")
-        await self._write_queue.put(message)
+        # Hand off directly when the SDK writer is ready; otherwise wait for it
+        try:
+            try:
+                self._write_stream.send_nowait(message)
+            except anyio.WouldBlock:
+                await self._write_stream.send(message)
+        except (anyio.ClosedResourceError, anyio.BrokenResourceError) as exc:
+            raise RuntimeError("StdioServerAdapter is closed") from exc
 
-    async def close(self) -> None:
-        """Shut down the adapter. Safe to call multiple times."""
-        if self._closed:
-            return
-        self._closed = True
-        # Signal the read queue so any waiting read() unblocks
-        await self._read_queue.put(_STREAM_CLOSED)
-        # Cancel bridge tasks
-        if self._reader_task and not self._reader_task.done():
-            self._reader_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await self._reader_task
-        if self._writer_task and not self._writer_task.done():
-            self._writer_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await self._writer_task
-
-    async def _reader_loop(
-        self,
-        read_stream: MemoryObjectReceiveStream[SessionMessage | Exception],
-    ) -> None:
-        """Bridge: pull from SDK anyio read stream, push to asyncio queue.
+    async def read_many(self, max_items: int = 32) -> list[SessionMessage]:
+        """Read the next message from the server plus any already queued.
 
         Args:
-            read_stream: The anyio receive stream from the SDK.
+            max_items: Upper bound on the number of messages returned.
+
+        Returns:
+            A non-empty list of SessionMessages in arrival order.
+
+        Raises:
+            RuntimeError: If the adapter has been closed.
         """
-        try:
-            async for item in read_stream:
-                if self._closed:
-                    break
-                if isinstance(item, Exception):
-                    logger.warning("Exception from server stream: %s", item)
-                    continue
-                await self._read_queue.put(item)
-        except Exception:
-            if not self._closed:
-                logger.debug("Reader loop ended", exc_info=True)
-        finally:
-            if not self._closed:
-                await self._read_queue.put(_STREAM_CLOSED)
-
-    async def _writer_loop(
-        self,
-        write_stream: MemoryObjectSendStream[SessionMessage],
-    ) -> None:
-        """Bridge: pull from asyncio queue, send to SDK anyio write stream.
+        batch = [await self.read()]
+        read_stream = self._read_stream
+        assert read_stream is not None
+        while len(batch) < max_items:
+            try:
+                item = read_stream.receive_nowait()
+            except (anyio.WouldBlock, anyio.EndOfStream, anyio.ClosedResourceError):
+                # Nothing more ready; end-of-stream surfaces on the next read()
+                break
+            if isinstance(item, Exception):
+                logger.warning("Exception from server stream: %s", item)
+                continue
+            batch.append(item)
+        return batch
+
+    async def write_many(self, messages: list[SessionMessage]) -> None:
+        """Write several messages to the server, in order.
 
         Args:
-            write_stream: The anyio send stream from the SDK.
+            messages: The SessionMessages to send to the server.
+
+        Raises:
+            RuntimeError: If the adapter has been closed.
         """
-        try:
-            while not self._closed:
-                message = await self._write_queue.get()
-                if self._closed:
-                    break
-                await write_stream.send(message)
-        except Exception:
-            if not self._closed:
-                logger.debug("Writer loop ended", exc_info=True)
+        for message in messages:
+            await self.write(message)
+
+    async def close(self) -> None:
+        """Shut down the adapter. Safe to call multiple times.
+
+        Subsequent read() and write() calls raise RuntimeError. The SDK
+        streams themselves are closed when the adapter context exits.
+        """
+        self._closed = True
 
 
 class StdioClientAdapter:
@@ -196,24 +187,17 @@ class StdioClientAdapter:
     """
 
     def __init__(self) -> None:
-        self._read_queue: asyncio.Queue[SessionMessage | object] = asyncio.Queue()
-        self._write_queue: asyncio.Queue[SessionMessage] = asyncio.Queue()
         self._closed = False
-        self._reader_task: asyncio.Task[None] | None = None
-        self._writer_task: asyncio.Task[None] | None = None
+        self._sdk_cm: AbstractAsyncContextManager[Any] | None = None
+        self._read_stream: MemoryObjectReceiveStream[SessionMessage | Exception] | None = None
+        self._write_stream: MemoryObjectSendStream[SessionMessage] | None = None
 
     async def __aenter__(self) -> StdioClientAdapter:
-        """Enter the adapter context — start SDK transport and bridge tasks."""
+        """Enter the adapter context — start the SDK transport."""
         self._sdk_cm = stdio_server()
         read_stream, write_stream = await self._sdk_cm.__aenter__()
-        self._reader_task = asyncio.create_task(
-            self._reader_loop(read_stream),
-            name="stdio-client-reader",
-        )
-        self._writer_task = asyncio.create_task(
-            self._writer_loop(write_stream),
-            name="stdio-client-writer",
-        )
+        self._read_stream = read_stream
+        self._write_stream = write_stream
         return self
 
     async def __aexit__(
@@ -222,9 +206,9 @@ class StdioClientAdapter:
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
-        """Exit the adapter context — clean up tasks and SDK transport."""
+        """Exit the adapter context — close and shut down the SDK transport."""
         await self.close()
-        if hasattr(self, "_sdk_cm"):
+        if self._sdk_cm is not None:
             try:
                 await self._sdk_cm.__aexit__(exc_type, exc_val, exc_tb)
             except Exception:
@@ -239,12 +223,17 @@ class StdioClientAdapter:
         Raises:
             RuntimeError: If the adapter has been closed.
         """
-        if self._closed:
+        if self._closed or self._read_stream is None:
             raise RuntimeError("StdioClientAdapter is closed")
-        item = await self._read_queue.get()
-        if item is _STREAM_CLOSED:
-            raise RuntimeError("StdioClientAdapter is closed")
-        return item  # type: ignore[return-value]
+        while True:
+            try:
+                item = await self._read_stream.receive()
+            except (anyio.EndOfStream, anyio.ClosedResourceError) as exc:
+                raise RuntimeError("StdioClientAdapter is closed") from exc
+            if isinstance(item, Exception):
+                logger.warning("Exception from client stream: %s", item)
+                continue
+            return item
 
     async def write(self, message: SessionMessage) -> None:
         """Write a message to the client.
@@ -255,64 +244,60 @@ class StdioClientAdapter:
         Raises:
             RuntimeError: If the adapter has been closed.
         """
-        if self._closed:
+        if self._closed or self._write_stream is None:
             raise RuntimeError("StdioClientAdapter is closed")
-        await self._write_queue.put(message)
+        # Hand off directly when the SDK writer is ready; otherwise wait for it
+        try:
+            try:
+                self._write_stream.send_nowait(message)
+            except anyio.WouldBlock:
+                await self._write_stream.send(message)
+        except (anyio.ClosedResourceError, anyio.BrokenResourceError) as exc:
+            raise RuntimeError("StdioClientAdapter is closed") from exc
 
-    async def close(self) -> None:
-        """Shut down the adapter. Safe to call multiple times."""
-        if self._closed:
-            return
-        self._closed = True
-        await self._read_queue.put(_STREAM_CLOSED)
-        if self._reader_task and not self._reader_task.done():
-            self._reader_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await self._reader_task
-        if self._writer_task and not self._writer_task.done():
-            self._writer_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await self._writer_task
-
-    async def _reader_loop(
-        self,
-        read_stream: MemoryObjectReceiveStream[SessionMessage | Exception],
-    ) -> None:
-        """Bridge: pull from SDK anyio read stream, push to asyncio queue.
+    async def read_many(self, max_items: int = 32) -> list[SessionMessage]:
+        """Read the next message from the client plus any already queued.
 
         Args:
-            read_stream: The anyio receive stream from the SDK.
+            max_items: Upper bound on the number of messages returned.
+
+        Returns:
+            A non-empty list of SessionMessages in arrival order.
+
+        Raises:
+            RuntimeError: If the adapter has been closed.
         """
-        try:
-            async for item in read_stream:
-                if self._closed:
-                    break
-                if isinstance(item, Exception):
-                    logger.warning("Exception from client stream: %s", item)
-                    continue
-                await self._read_queue.put(item)
-        except Exception:
-            if not self._closed:
-                logger.debug("Reader loop ended", exc_info=True)
-        finally:
-            if not self._closed:
-                await self._read_queue.put(_STREAM_CLOSED)
-
-    async def _writer_loop(
-        self,
-        write_stream: MemoryObjectSendStream[SessionMessage],
-    ) -> None:
-        """Bridge: pull from asyncio queue, send to SDK anyio write stream.
+        batch = [await self.read()]
+        read_stream = self._read_stream
+        assert read_stream is not None
+        while len(batch) < max_items:
+            try:
+                item = read_stream.receive_nowait()
+            except (anyio.WouldBlock, anyio.EndOfStream, anyio.ClosedResourceError):
+                # Nothing more ready; end-of-stream surfaces on the next read()
+                break
+            if isinstance(item, Exception):
+                logger.warning("Exception from client stream: %s", item)
+                continue
+            batch.append(item)
+        return batch
+
+    async def write_many(self, messages: list[SessionMessage]) -> None:
+        """Write several messages to the client, in order.
 
         Args:
-            write_stream: The anyio send stream from the SDK.
+            messages: The SessionMessages to send to the client.
+
+        Raises:
+            RuntimeError: If the adapter has been closed.
         """
-        try:
-            while not self._closed:
-                message = await self._write_queue.get()
-                if self._closed:
-                    break
-                await write_stream.send(message)
-        except Exception:
-            if not self._closed:
-                logger.debug("Writer loop ended", exc_info=True)
+        for message in messages:
+            await self.write(message)
+
+    async def close(self) -> None:
+        """Shut down the adapter. Safe to call multiple times.
+
+        Subsequent read() and write() calls raise RuntimeError. The SDK
+        streams themselves are closed when the adapter context exits.
+        """
+        self._closed = True
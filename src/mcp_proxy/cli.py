@@ -1,4 +1,8 @@
-"""CLI entry point for mcp-proxy."""
+"""CLI entry point for mcp-proxy.
+
+Only Click is imported at module level so ``--help`` and argument errors
+stay fast; each command imports the MCP SDK, models, and TUI it needs.
+"""
 
 from __future__ import annotations
 
@@ -7,22 +11,64 @@ from typing import TYPE_CHECKING
 
 import click
 
-from mcp_proxy.models import Transport
-
 if TYPE_CHECKING:
+    from mcp.types import JSONRPCMessage
+
     from mcp_proxy.replay import ReplayResult, ReplaySessionResult
 
+# ``--transport`` choice -> Transport member name (models import stays lazy)
+_TRANSPORT_NAMES: dict[str, str] = {
+    "stdio": "STDIO",
+    "sse": "SSE",
+    "streamable-http": "STREAMABLE_HTTP",
+}
+
+# Number of buffered output lines after which ``inspect``/``replay`` write to stdout
+_ECHO_FLUSH_LINES = 256
+
+# One ``inspect`` message line: sequence, arrow, method, id, correlation, modified
+_INSPECT_LINE = "  #%03d %s %s%s%s%s"
+
 
 @click.group()
 @click.version_option()
-def main() -> None:
+@click.option(
+    "--uvloop",
+    "use_uvloop",
+    is_flag=True,
+    default=False,
+    help="Run on the uvloop event loop (Linux/macOS; install the 'perf' extra).",
+)
+def main(use_uvloop: bool) -> None:
     """Interactive MCP traffic interceptor for security research."""
+    if use_uvloop:
+        _install_uvloop()
+
+
+def _install_uvloop() -> None:
+    """Switch asyncio to the uvloop event loop policy.
+
+    Applies to every loop created afterwards, including the Textual app
+    loop and ``asyncio.run()`` in replay.
+
+    Raises:
+        click.UsageError: If uvloop is not installed.
+    """
+    import asyncio
+
+    try:
+        import uvloop
+    except ImportError as exc:
+        raise click.UsageError(
+            "--uvloop requires uvloop. Install it with: pip install 'mcp-proxy[perf]'"
+        ) from exc
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
 
 @main.command()
 @click.option(
     "--transport",
-    type=click.Choice(["stdio", "sse", "streamable-http"], case_sensitive=False),
+    type=click.Choice(list(_TRANSPORT_NAMES), case_sensitive=False),
     required=True,
     help="MCP transport type.",
 )
@@ -46,9 +92,10 @@ def proxy(
     if transport in ("sse", "streamable-http") and not target_url:
         raise click.UsageError("--target-url is required for SSE/HTTP transport.")
 
+    from mcp_proxy.models import Transport
     from mcp_proxy.tui.app import ProxyApp
 
-    transport_enum = Transport(transport.replace("-", "_"))
+    transport_enum = Transport[_TRANSPORT_NAMES[transport]]
     app = ProxyApp(
         transport=transport_enum,
         server_command=target_command,
@@ -71,6 +118,14 @@ def proxy(
     default=False,
     help="Skip auto-handshake (if session already includes initialize).",
 )
+@click.option(
+    "--max-in-flight",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Requests awaiting responses at once (raise only for servers that handle "
+    "concurrent requests).",
+)
 def replay(
     session_file: str,
     target_command: str | None,
@@ -78,6 +133,7 @@ def replay(
     output: str | None,
     timeout: float,
     no_handshake: bool,
+    max_in_flight: int,
 ) -> None:
     """Replay a saved session against a live server."""
     import asyncio
@@ -114,11 +170,15 @@ def replay(
     click.echo(f'Replaying {len(c2s_messages)} messages against "{target_command}"...')
 
     # Run replay
-    session_result = asyncio.run(_run_replay(command, args, messages, timeout, not no_handshake))
+    session_result = asyncio.run(
+        _run_replay(command, args, messages, timeout, not no_handshake, max_in_flight)
+    )
 
-    # Print summary
+    # Print summary — buffered like inspect's message list
     succeeded = 0
     failed = 0
+    lines: list[str] = []
+    append = lines.append
     for i, r in enumerate(session_result.results):
         method = r.original_request.method or "(response)"
         msg_id = r.original_request.jsonrpc_id
@@ -129,17 +189,23 @@ def replay(
             id_str = " (notification)"
 
         if r.error:
-            click.echo(f"  #{i:03d} → {method}{id_str} ✗ {r.error}")
+            append(f"  #{i:03d} → {method}{id_str} ✗ {r.error}")
             failed += 1
         elif r.response is not None:
-            click.echo(f"  #{i:03d} → {method}{id_str} ✓ {r.duration_ms:.0f}ms")
+            append(f"  #{i:03d} → {method}{id_str} ✓ {r.duration_ms:.0f}ms")
             succeeded += 1
         else:
             # Notification (no response expected)
-            click.echo(f"  #{i:03d} → {method}{id_str} ✓")
+            append(f"  #{i:03d} → {method}{id_str} ✓")
             succeeded += 1
 
-    click.echo("")
+        if len(lines) >= _ECHO_FLUSH_LINES:
+            click.echo("\n".join(lines))
+            lines.clear()
+
+    # Trailing empty line separates the results from the totals
+    append("")
+    click.echo("\n".join(lines))
     total = succeeded + failed
     parts_summary = [f"{succeeded}/{total} succeeded"]
     if failed:
@@ -160,35 +226,57 @@ def _save_replay_results(
 ) -> None:
     """Serialize replay results to JSON.
 
+    JSON-RPC payloads are embedded in compact form inside the indented
+    results document.
+
     Args:
         session_result: The replay session results.
         output_path: Path to write JSON output.
         target_command: The server command used for replay.
     """
-    import json
     from typing import Any
 
+    import orjson
+    from mcp.types import JSONRPCMessage
+
+    # Bound once: calling the core serializer skips model_dump_json's
+    # per-call wrapper and returns bytes, which Fragment takes as-is
+    to_json = JSONRPCMessage.__pydantic_serializer__.to_json
+
+    def _message_json(message: JSONRPCMessage) -> orjson.Fragment:
+        # Pydantic's serializer emits JSON directly; orjson embeds it as-is,
+        # so no intermediate dict is built or re-encoded
+        return orjson.Fragment(to_json(message, by_alias=True, exclude_none=True))
+
     def _serialize_result(r: ReplayResult) -> dict[str, Any]:
         entry: dict[str, Any] = {
-            "original_request": r.original_request.raw.model_dump(by_alias=True, exclude_none=True),
-            "sent_message": r.sent_message.message.model_dump(by_alias=True, exclude_none=True),
-            "response": (
-                r.response.message.model_dump(by_alias=True, exclude_none=True)
-                if r.response
-                else None
-            ),
+            "original_request": _message_json(r.original_request.raw),
+            "sent_message": _message_json(r.sent_message.message),
+            "response": _message_json(r.response.message) if r.response else None,
             "error": r.error,
             "duration_ms": r.duration_ms,
         }
         return entry
 
-    data = {
-        "target_command": target_command,
-        "target_url": session_result.target_url,
-        "results": [_serialize_result(r) for r in session_result.results],
-    }
+    header = orjson.dumps(
+        {"target_command": target_command, "target_url": session_result.target_url},
+        option=orjson.OPT_INDENT_2,
+    )
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    # Results are encoded and written one at a time so only a single entry's
+    # JSON is in memory; the bytes match dumping the whole document at once
+    with output_path.open("wb") as f:
+        f.write(header.removesuffix(b"\n}"))
+        f.write(b',\n  "results": [')
+        separator = b"\n    "
+        for r in session_result.results:
+            f.write(separator)
+            # Re-indent one level for nesting inside "results"; JSON strings
+            # never contain raw newlines, so only layout newlines are touched
+            entry = orjson.dumps(_serialize_result(r), option=orjson.OPT_INDENT_2)
+            f.write(entry.replace(b"\n", b"\n    "))
+            separator = b",\n    "
+        f.write(b"\n  ]\n}" if session_result.results else b"]\n}")
 
 
 async def _run_replay(
@@ -197,6 +285,7 @@ async def _run_replay(
     messages: list,
     timeout: float,
     auto_handshake: bool,
+    max_in_flight: int = 1,
 ) -> ReplaySessionResult:
     """Run the replay against a stdio server adapter.
 
@@ -206,6 +295,7 @@ async def _run_replay(
         messages: All ProxyMessages from the session.
         timeout: Per-message response timeout.
         auto_handshake: Whether to send synthetic handshake.
+        max_in_flight: Requests allowed to await responses at once.
 
     Returns:
         ReplaySessionResult with all replay results.
@@ -215,7 +305,11 @@ async def _run_replay(
 
     async with StdioServerAdapter(command=command, args=args) as adapter:
         results = await replay_messages(
-            messages, adapter, timeout=timeout, auto_handshake=auto_handshake
+            messages,
+            adapter,
+            timeout=timeout,
+            auto_handshake=auto_handshake,
+            max_in_flight=max_in_flight,
         )
     return ReplaySessionResult(
         results=results,
@@ -258,6 +352,7 @@ def inspect(session_file: str, verbose: bool) -> None:
     """Print session contents to stdout (non-interactive)."""
     import json
 
+    from mcp_proxy.models import Direction
     from mcp_proxy.session_store import SessionStore
 
     try:
@@ -268,34 +363,55 @@ def inspect(session_file: str, verbose: bool) -> None:
     session = store.to_proxy_session()
     messages = store.get_messages()
 
+    # Header and message list share one buffer, emitted in chunks so large
+    # sessions don't pay one stdout write + flush per line
+    lines: list[str] = []
+    append = lines.append
+
     # Session header
-    click.echo(f"Session: {session.id}")
-    click.echo(f"Transport: {session.transport.value}")
+    append(f"Session: {session.id}")
+    append(f"Transport: {session.transport.value}")
     if session.server_command:
-        click.echo(f"Server command: {session.server_command}")
+        append(f"Server command: {session.server_command}")
     if session.server_url:
-        click.echo(f"Server URL: {session.server_url}")
-    click.echo(f"Started: {session.started_at.isoformat()}")
-    click.echo(f"Messages: {len(messages)}")
+        append(f"Server URL: {session.server_url}")
+    append(f"Started: {session.started_at.isoformat()}")
+    append(f"Messages: {len(messages)}")
     if session.metadata:
-        click.echo(f"Metadata: {json.dumps(session.metadata)}")
-    click.echo("---")
+        append(f"Metadata: {json.dumps(session.metadata)}")
+    append("---")
 
     # Message list
     for msg in messages:
-        direction = "→" if msg.direction.value == "client_to_server" else "←"
-        method_str = msg.method or "(response)"
-        id_str = f" id={msg.jsonrpc_id}" if msg.jsonrpc_id is not None else ""
-        modified_str = " [MODIFIED]" if msg.modified else ""
-        corr_str = f" corr={msg.correlated_id[:8]}..." if msg.correlated_id else ""
-
-        click.echo(
-            f"  #{msg.sequence:03d} {direction} {method_str}{id_str}{corr_str}{modified_str}"
+        direction = "→" if msg.direction is Direction.CLIENT_TO_SERVER else "←"
+        jsonrpc_id = msg.jsonrpc_id
+        correlated_id = msg.correlated_id
+        append(
+            _INSPECT_LINE
+            % (
+                msg.sequence,
+                direction,
+                msg.method or "(response)",
+                f" id={jsonrpc_id}" if jsonrpc_id is not None else "",
+                f" corr={correlated_id[:8]}..." if correlated_id else "",
+                " [MODIFIED]" if msg.modified else "",
+            )
         )
 
         if verbose:
-            payload = msg.raw.model_dump(by_alias=True, exclude_none=True)
-            click.echo(f"       {json.dumps(payload, indent=2)}")
+            # Serialize straight from the model — no intermediate dict.
+            # Non-ASCII text is printed as-is rather than \u-escaped
+            payload = msg.raw.model_dump_json(by_alias=True, exclude_none=True, indent=2)
+            append(f"       {payload}")
             if msg.original_raw is not None:
-                original = msg.original_raw.model_dump(by_alias=True, exclude_none=True)
-                click.echo(f"       [original] {json.dumps(original, indent=2)}")
+                original = msg.original_raw.model_dump_json(
+                    by_alias=True, exclude_none=True, indent=2
+                )
+                append(f"       [original] {original}")
+
+        if len(lines) >= _ECHO_FLUSH_LINES:
+            click.echo("\n".join(lines))
+            lines.clear()
+
+    if lines:
+        click.echo("\n".join(lines))
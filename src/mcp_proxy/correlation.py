@@ -3,9 +3,14 @@
 Insulates the rest of the codebase from the MCP SDK's JSONRPCMessage
 internal structure. The pipeline, session store, and correlation logic
 use these helpers instead of reaching into raw message internals.
+
+Classification dispatches on the exact type of ``message.root`` through
+module-level lookup tables (one ``type()`` call and one dict/set lookup)
+rather than chains of ``isinstance`` checks.
 """
 
-from typing import cast
+from collections.abc import Callable
+from typing import Any, Literal, NamedTuple, cast
 
 from mcp.types import (
     JSONRPCError,
@@ -16,6 +21,68 @@ from mcp.types import (
 )
 
 
+def _root_id(root: Any) -> str | int:
+    return cast(str | int, root.id)
+
+
+def _root_method(root: Any) -> str:
+    return cast(str, root.method)
+
+
+# Root type -> field getter; types absent from a table lack that field
+_ID_GETTERS: dict[type, Callable[[Any], str | int]] = {
+    JSONRPCRequest: _root_id,
+    JSONRPCResponse: _root_id,
+    JSONRPCError: _root_id,
+}
+_METHOD_GETTERS: dict[type, Callable[[Any], str]] = {
+    JSONRPCRequest: _root_method,
+    JSONRPCNotification: _root_method,
+}
+_RESPONSE_TYPES: frozenset[type] = frozenset({JSONRPCResponse, JSONRPCError})
+
+MessageKind = Literal["req", "resp", "notif"]
+
+
+class ClassifiedMessage(NamedTuple):
+    """JSON-RPC fields extracted from a message in a single pass.
+
+    Attributes:
+        id: The id for requests, responses, and errors; None for notifications.
+        method: The method for requests and notifications; None otherwise.
+        kind: "req", "resp" (responses and errors), or "notif".
+    """
+
+    id: str | int | None
+    method: str | None
+    kind: MessageKind
+
+
+_CLASSIFIERS: dict[type, Callable[[Any], ClassifiedMessage]] = {
+    JSONRPCRequest: lambda r: ClassifiedMessage(r.id, r.method, "req"),
+    JSONRPCResponse: lambda r: ClassifiedMessage(r.id, None, "resp"),
+    JSONRPCError: lambda r: ClassifiedMessage(r.id, None, "resp"),
+    JSONRPCNotification: lambda r: ClassifiedMessage(None, r.method, "notif"),
+}
+
+
+def classify(message: JSONRPCMessage) -> ClassifiedMessage:
+    """Extract id, method, and kind from a message in one dispatch.
+
+    Equivalent to calling extract_jsonrpc_id, extract_method, and the
+    is_* predicates separately, for callers that need all of them.
+
+    Args:
+        message: A JSONRPCMessage (RootModel wrapping a request, response,
+            notification, or error).
+
+    Returns:
+        A ClassifiedMessage with the id, method, and kind.
+    """
+    root = message.root
+    return _CLASSIFIERS[type(root)](root)
+
+
 def extract_jsonrpc_id(message: JSONRPCMessage) -> str | int | None:
     """Extract the JSON-RPC id field from a message.
 
@@ -28,11 +95,8 @@ def extract_jsonrpc_id(message: JSONRPCMessage) -> str | int | None:
         None for notifications (which have no id field).
     """
     root = message.root
-    if isinstance(root, JSONRPCRequest):
-        return cast(str | int, root.id)
-    if isinstance(root, (JSONRPCResponse, JSONRPCError)):
-        return cast(str | int, root.id)
-    return None
+    getter = _ID_GETTERS.get(type(root))
+    return getter(root) if getter is not None else None
 
 
 def extract_method(message: JSONRPCMessage) -> str | None:
@@ -47,11 +111,8 @@ def extract_method(message: JSONRPCMessage) -> str | None:
         None for responses and errors (which have no method field).
     """
     root = message.root
-    if isinstance(root, JSONRPCRequest):
-        return cast(str, root.method)
-    if isinstance(root, JSONRPCNotification):
-        return cast(str, root.method)
-    return None
+    getter = _METHOD_GETTERS.get(type(root))
+    return getter(root) if getter is not None else None
 
 
 def is_request(message: JSONRPCMessage) -> bool:
@@ -63,7 +124,7 @@ def is_request(message: JSONRPCMessage) -> bool:
     Returns:
         True if the message is a request.
     """
-    return isinstance(message.root, JSONRPCRequest)
+    return type(message.root) is JSONRPCRequest
 
 
 def is_response(message: JSONRPCMessage) -> bool:
@@ -75,7 +136,7 @@ def is_response(message: JSONRPCMessage) -> bool:
     Returns:
         True if the message is a response or error.
     """
-    return isinstance(message.root, JSONRPCResponse | JSONRPCError)
+    return type(message.root) in _RESPONSE_TYPES
 
 
 def is_notification(message: JSONRPCMessage) -> bool:
@@ -87,4 +148,4 @@ def is_notification(message: JSONRPCMessage) -> bool:
     Returns:
         True if the message is a notification.
     """
-    return isinstance(message.root, JSONRPCNotification)
+    return type(message.root) is JSONRPCNotification
@@ -35,7 +35,12 @@ class InterceptEngine:
 
     def __init__(self, mode: InterceptMode = InterceptMode.PASSTHROUGH) -> None:
         self._mode = mode
-        self._held: list[HeldMessage] = []
+        # Checked once per message by should_hold(); kept in sync by set_mode()
+        self._holding = mode == InterceptMode.INTERCEPT
+        # Keyed by ProxyMessage.id; dicts keep insertion (hold) order
+        self._held: dict[str, HeldMessage] = {}
+        # Immutable view of _held shared between callers; None when stale
+        self._held_snapshot: tuple[HeldMessage, ...] | None = None
 
     @property
     def mode(self) -> InterceptMode:
@@ -50,8 +55,9 @@ class InterceptEngine:
                 currently held messages are released with FORWARD action.
         """
         self._mode = mode
+        self._holding = mode == InterceptMode.INTERCEPT
         if mode == InterceptMode.PASSTHROUGH:
-            for held in list(self._held):
+            for held in self.get_held():
                 self.release(held, InterceptAction.FORWARD)
 
     def should_hold(self, message: ProxyMessage) -> bool:
@@ -63,7 +69,7 @@ class InterceptEngine:
         Returns:
             True if the engine is in INTERCEPT mode.
         """
-        return self._mode == InterceptMode.INTERCEPT
+        return self._holding
 
     def hold(self, message: ProxyMessage) -> HeldMessage:
         """Hold a message for user inspection.
@@ -80,7 +86,8 @@ class InterceptEngine:
             action=None,
             modified_raw=None,
         )
-        self._held.append(held)
+        self._held[message.id] = held
+        self._held_snapshot = None
         return held
 
     def release(
@@ -99,16 +106,37 @@ class InterceptEngine:
         held.action = action
         held.modified_raw = modified_raw
         held.release.set()
-        if held in self._held:
-            self._held.remove(held)
+        if self._held.pop(held.proxy_message.id, None) is not None:
+            self._held_snapshot = None
 
-    def get_held(self) -> list[HeldMessage]:
-        """Return the list of currently held messages.
+    def get_held(self) -> tuple[HeldMessage, ...]:
+        """Return the currently held messages.
+
+        The same tuple is returned until a message is held or released,
+        so repeated calls between changes do not copy.
+
+        Returns:
+            Tuple of HeldMessage objects awaiting user action, in hold order.
+        """
+        if self._held_snapshot is None:
+            self._held_snapshot = tuple(self._held.values())
+        return self._held_snapshot
+
+    @property
+    def held_count(self) -> int:
+        """Number of messages currently held."""
+        return len(self._held)
+
+    def get_held_by_id(self, proxy_id: str) -> HeldMessage | None:
+        """Look up a held message by its ProxyMessage id.
+
+        Args:
+            proxy_id: The ProxyMessage.id to look up.
 
         Returns:
-            List of HeldMessage objects awaiting user action.
+            The HeldMessage, or None if that message is not held.
         """
-        return list(self._held)
+        return self._held.get(proxy_id)
 
     def get_state(self) -> InterceptState:
         """Return a snapshot of the current intercept state.
@@ -116,4 +144,4 @@ class InterceptEngine:
         Returns:
             InterceptState with current mode and held messages.
         """
-        return InterceptState(mode=self._mode, held_messages=list(self._held))
+        return InterceptState(mode=self._mode, held_messages=self.get_held())
@@ -7,7 +7,7 @@ session containers for capture/export, and intercept engine state.
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime
 from enum import StrEnum
 from typing import Any
@@ -68,12 +68,12 @@ class InterceptAction(StrEnum):
     DROP = "drop"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProxyMessage:
     """A single intercepted MCP JSON-RPC message with proxy metadata.
 
     Args:
-        id: Unique proxy-assigned ID (UUID string).
+        id: Unique proxy-assigned ID (UUID-formatted string).
         sequence: Monotonic sequence number within the session.
         timestamp: When the proxy received this message.
         direction: CLIENT_TO_SERVER or SERVER_TO_CLIENT.
@@ -99,7 +99,7 @@ class ProxyMessage:
     original_raw: JSONRPCMessage | None
 
 
-@dataclass
+@dataclass(slots=True)
 class HeldMessage:
     """A message held by the intercept engine, awaiting user action.
 
@@ -116,7 +116,7 @@ class HeldMessage:
     modified_raw: JSONRPCMessage | None
 
 
-@dataclass
+@dataclass(slots=True)
 class InterceptState:
     """Current state of the intercept engine.
 
@@ -126,7 +126,7 @@ class InterceptState:
     """
 
     mode: InterceptMode
-    held_messages: list[HeldMessage] = field(default_factory=list)
+    held_messages: tuple[HeldMessage, ...] = ()
 
 
 class ProxySession(BaseModel):
@@ -18,12 +18,7 @@ from datetime import UTC, datetime
 from mcp.shared.message import SessionMessage
 
 from mcp_proxy.adapters.base import TransportAdapter
-from mcp_proxy.correlation import (
-    extract_jsonrpc_id,
-    extract_method,
-    is_request,
-    is_response,
-)
+from mcp_proxy.correlation import ClassifiedMessage, classify
 from mcp_proxy.intercept import InterceptEngine
 from mcp_proxy.models import (
     Direction,
@@ -46,6 +41,9 @@ class PipelineSession:
         on_message: Called when a message is received (before intercept).
         on_held: Called when a message is held by the intercept engine.
         on_forwarded: Called after a message is forwarded to its destination.
+        correlation_limit: Most requests awaiting a response that are kept
+            for correlation; the oldest is forgotten beyond this, so
+            requests that never get a reply cannot grow memory unbounded.
     """
 
     session_store: SessionStore
@@ -54,6 +52,7 @@ class PipelineSession:
     on_message: Callable[[ProxyMessage], None] | None = None
     on_held: Callable[[HeldMessage], None] | None = None
     on_forwarded: Callable[[ProxyMessage], None] | None = None
+    correlation_limit: int = 4096
 
 
 async def run_pipeline(
@@ -73,6 +72,10 @@ async def run_pipeline(
     """
     seq = itertools.count()
     correlation_map: dict[str | int, str] = {}
+    # Message ids are the hex sequence number followed by this random tail,
+    # which keeps them UUID-shaped and unique across runs without an RNG
+    # call per message. "-xxxx-4xxx-yxxx-xxxxxxxxxxxx"
+    id_suffix = str(uuid.uuid4())[8:]
 
     try:
         async with asyncio.TaskGroup() as tg:
@@ -83,6 +86,7 @@ async def run_pipeline(
                     direction=Direction.CLIENT_TO_SERVER,
                     session=session,
                     seq=seq,
+                    id_suffix=id_suffix,
                     correlation_map=correlation_map,
                 )
             )
@@ -93,6 +97,7 @@ async def run_pipeline(
                     direction=Direction.SERVER_TO_CLIENT,
                     session=session,
                     seq=seq,
+                    id_suffix=id_suffix,
                     correlation_map=correlation_map,
                 )
             )
@@ -108,88 +113,157 @@ async def _forward_loop(
     direction: Direction,
     session: PipelineSession,
     seq: itertools.count[int],
+    id_suffix: str,
     correlation_map: dict[str | int, str],
 ) -> None:
     """Forward messages from source to destination.
 
+    Reads whatever the source has ready as one batch and forwards it with
+    a single write_many() call, so a burst costs one adapter round trip
+    instead of one per message. Messages queued ahead of a held message
+    are flushed before the hold, preserving order and keeping earlier
+    traffic flowing while the user inspects.
+
     Args:
         source: Adapter to read from.
         destination: Adapter to write to.
         direction: CLIENT_TO_SERVER or SERVER_TO_CLIENT.
         session: Pipeline dependencies and callbacks.
         seq: Shared monotonic sequence counter.
+        id_suffix: Per-run tail appended to the sequence to form message ids.
         correlation_map: Shared JSON-RPC id to ProxyMessage.id mapping.
     """
+    pending: list[tuple[SessionMessage, ProxyMessage]] = []
+    # Per-message lookups resolved once; the session is fixed for the run
+    transport = session.transport
+    capture = session.session_store.append
+    on_message = session.on_message
+    should_hold = session.intercept_engine.should_hold
     while True:
-        session_message = await source.read()
-        proxy_msg = _wrap_message(session_message, direction, session.transport, seq)
-
-        # Correlate responses to requests
-        if is_request(session_message.message) and proxy_msg.jsonrpc_id is not None:
-            correlation_map[proxy_msg.jsonrpc_id] = proxy_msg.id
-        elif is_response(session_message.message) and proxy_msg.jsonrpc_id is not None:
-            correlated = correlation_map.pop(proxy_msg.jsonrpc_id, None)
-            if correlated is not None:
-                proxy_msg.correlated_id = correlated
-
-        # Capture
-        session.session_store.append(proxy_msg)
-
-        # Notify
-        if session.on_message is not None:
-            session.on_message(proxy_msg)
-
-        # Intercept check
-        if session.intercept_engine.should_hold(proxy_msg):
-            held = session.intercept_engine.hold(proxy_msg)
-            if session.on_held is not None:
-                session.on_held(held)
-            await held.release.wait()
-
-            if held.action == InterceptAction.DROP:
-                continue
-
-            if held.action == InterceptAction.MODIFY and held.modified_raw is not None:
-                proxy_msg.original_raw = proxy_msg.raw
-                proxy_msg.raw = held.modified_raw
-                proxy_msg.modified = True
-                session_message = SessionMessage(message=held.modified_raw)
+        for session_message in await source.read_many():
+            classified = classify(session_message.message)
+            proxy_msg = _wrap_message(
+                session_message, classified, direction, transport, seq, id_suffix
+            )
+
+            # Correlate responses to requests
+            jsonrpc_id = classified.id
+            if jsonrpc_id is not None:
+                if classified.kind == "req":
+                    _remember_request(
+                        correlation_map, jsonrpc_id, proxy_msg.id, session.correlation_limit
+                    )
+                elif classified.kind == "resp":
+                    proxy_msg.correlated_id = correlation_map.pop(jsonrpc_id, None)
+
+            # Capture
+            capture(proxy_msg)
+
+            # Notify
+            if on_message is not None:
+                on_message(proxy_msg)
+
+            # Intercept check
+            if should_hold(proxy_msg):
+                await _flush(destination, pending, session)
+                held = session.intercept_engine.hold(proxy_msg)
+                if session.on_held is not None:
+                    session.on_held(held)
+                await held.release.wait()
+
+                if held.action == InterceptAction.DROP:
+                    continue
+
+                if held.action == InterceptAction.MODIFY and held.modified_raw is not None:
+                    proxy_msg.original_raw = proxy_msg.raw
+                    proxy_msg.raw = held.modified_raw
+                    proxy_msg.modified = True
+                    # Swap the payload in place so transport metadata is kept
+                    session_message.message = held.modified_raw
+
+            pending.append((session_message, proxy_msg))
 
         # Forward
-        await destination.write(session_message)
+        await _flush(destination, pending, session)
+
+
+async def _flush(
+    destination: TransportAdapter,
+    pending: list[tuple[SessionMessage, ProxyMessage]],
+    session: PipelineSession,
+) -> None:
+    """Write pending messages to the destination and clear the list.
 
-        # Notify forwarded
-        if session.on_forwarded is not None:
+    Args:
+        destination: Adapter to write to.
+        pending: Messages awaiting forwarding with their envelopes, in order.
+        session: Pipeline dependencies and callbacks.
+    """
+    if not pending:
+        return
+    await destination.write_many([session_message for session_message, _ in pending])
+
+    # Notify forwarded
+    if session.on_forwarded is not None:
+        for _, proxy_msg in pending:
             session.on_forwarded(proxy_msg)
+    pending.clear()
+
+
+def _remember_request(
+    correlation_map: dict[str | int, str],
+    jsonrpc_id: str | int,
+    proxy_id: str,
+    limit: int,
+) -> None:
+    """Record a request for correlation, evicting the oldest beyond limit.
+
+    Dicts keep insertion order, so the first key is the longest-waiting
+    request. A reused id is moved to the end as the newest entry.
+
+    Args:
+        correlation_map: Shared JSON-RPC id to ProxyMessage.id mapping.
+        jsonrpc_id: The request's JSON-RPC id.
+        proxy_id: The request's ProxyMessage.id.
+        limit: Maximum entries to keep.
+    """
+    correlation_map.pop(jsonrpc_id, None)
+    correlation_map[jsonrpc_id] = proxy_id
+    if len(correlation_map) > limit:
+        del correlation_map[next(iter(correlation_map))]
 
 
 def _wrap_message(
     session_message: SessionMessage,
+    classified: ClassifiedMessage,
     direction: Direction,
     transport: Transport,
     seq: itertools.count[int],
+    id_suffix: str,
 ) -> ProxyMessage:
     """Wrap a SessionMessage in a ProxyMessage envelope.
 
     Args:
         session_message: The raw SDK message.
+        classified: JSON-RPC fields already extracted from the message.
         direction: CLIENT_TO_SERVER or SERVER_TO_CLIENT.
         transport: The transport type.
         seq: Shared monotonic sequence counter.
+        id_suffix: Per-run tail appended to the sequence to form the id.
 
     Returns:
-        A ProxyMessage with UUID, sequence, timestamp, and extracted fields.
+        A ProxyMessage with id, sequence, timestamp, and extracted fields.
     """
-    raw = session_message.message
+    sequence = next(seq)
     return ProxyMessage(
-        id=str(uuid.uuid4()),
-        sequence=next(seq),
+        id=f"{sequence:08x}{id_suffix}",
+        sequence=sequence,
         timestamp=datetime.now(tz=UTC),
         direction=direction,
         transport=transport,
-        raw=raw,
-        jsonrpc_id=extract_jsonrpc_id(raw),
-        method=extract_method(raw),
+        raw=session_message.message,
+        jsonrpc_id=classified.id,
+        method=classified.method,
         correlated_id=None,
         modified=False,
         original_raw=None,
@@ -62,6 +62,7 @@ async def replay_messages(
     server_adapter: TransportAdapter,
     timeout: float = 10.0,
     auto_handshake: bool = True,
+    max_in_flight: int = 1,
 ) -> list[ReplayResult]:
     """Replay a list of messages against a connected server adapter.
 
@@ -76,9 +77,13 @@ async def replay_messages(
         timeout: Seconds to wait for each response.
         auto_handshake: If True and first message is not initialize,
             send a synthetic handshake before replaying.
+        max_in_flight: Requests allowed to await responses at once. With
+            the default of 1 each request waits for its response before
+            the next is sent; higher values keep sending in order while
+            earlier responses are outstanding.
 
     Returns:
-        A ReplayResult for each replayed message.
+        A ReplayResult for each replayed message, in send order.
     """
     # Filter to client-to-server only
     c2s_messages = [m for m in messages if m.direction == Direction.CLIENT_TO_SERVER]
@@ -90,6 +95,9 @@ async def replay_messages(
     if needs_handshake:
         await _send_handshake(server_adapter, timeout)
 
+    if max_in_flight > 1:
+        return await _replay_windowed(c2s_messages, server_adapter, timeout, max_in_flight)
+
     results: list[ReplayResult] = []
     for msg in c2s_messages:
         result = await _replay_single(msg, server_adapter, timeout)
@@ -210,6 +218,140 @@ async def _replay_single(
         )
 
 
+async def _replay_windowed(
+    messages: list[ProxyMessage],
+    adapter: TransportAdapter,
+    timeout: float,
+    max_in_flight: int,
+) -> list[ReplayResult]:
+    """Replay messages with up to max_in_flight requests outstanding.
+
+    Messages are written strictly in order. A single reader task routes
+    each response to the request awaiting its JSON-RPC id, so responses
+    may arrive in any order. A request whose id is still outstanding
+    waits for the earlier one to finish before it is sent.
+
+    Args:
+        messages: ProxyMessages to replay (client-to-server only).
+        adapter: The server adapter.
+        timeout: Seconds to wait for each response.
+        max_in_flight: Maximum requests awaiting responses at once.
+
+    Returns:
+        A ReplayResult for each replayed message, in send order.
+    """
+    loop = asyncio.get_running_loop()
+    pending: dict[str | int | None, asyncio.Future[SessionMessage]] = {}
+    window = asyncio.Semaphore(max_in_flight)
+
+    async def await_response(
+        msg: ProxyMessage,
+        session_message: SessionMessage,
+        future: asyncio.Future[SessionMessage],
+        start: float,
+    ) -> ReplayResult:
+        response: SessionMessage | None = None
+        error: str | None = None
+        try:
+            response = await asyncio.wait_for(future, timeout=timeout)
+        except TimeoutError:
+            error = f"Timeout after {timeout}s"
+        except Exception as exc:
+            error = f"Read failed: {exc}"
+        finally:
+            if pending.get(msg.jsonrpc_id) is future:
+                del pending[msg.jsonrpc_id]
+            window.release()
+        return ReplayResult(
+            original_request=msg,
+            sent_message=session_message,
+            response=response,
+            error=error,
+            duration_ms=(time.perf_counter() - start) * 1000,
+        )
+
+    reader = asyncio.create_task(_dispatch_responses(adapter, pending))
+    outcomes: list[ReplayResult | asyncio.Task[ReplayResult]] = []
+    try:
+        for msg in messages:
+            if is_notification(msg.raw):
+                # Fire-and-forget; never occupies the window
+                outcomes.append(await _replay_single(msg, adapter, timeout))
+                continue
+
+            await window.acquire()
+            earlier = pending.get(msg.jsonrpc_id)
+            if earlier is not None:
+                # Same id still outstanding; its reply could not be told apart
+                await asyncio.wait({earlier})
+
+            future: asyncio.Future[SessionMessage] = loop.create_future()
+            if reader.done():
+                # Adapter already closed; fail like a sequential read would
+                future.set_exception(reader.exception() or RuntimeError("reader stopped"))
+            else:
+                pending[msg.jsonrpc_id] = future
+
+            session_message = SessionMessage(message=msg.raw)
+            start = time.perf_counter()
+            try:
+                await adapter.write(session_message)
+            except Exception as exc:
+                pending.pop(msg.jsonrpc_id, None)
+                future.cancel()
+                window.release()
+                outcomes.append(
+                    ReplayResult(
+                        original_request=msg,
+                        sent_message=session_message,
+                        response=None,
+                        error=f"Write failed: {exc}",
+                        duration_ms=(time.perf_counter() - start) * 1000,
+                    )
+                )
+                continue
+
+            outcomes.append(
+                asyncio.create_task(await_response(msg, session_message, future, start))
+            )
+
+        return [
+            outcome if isinstance(outcome, ReplayResult) else await outcome for outcome in outcomes
+        ]
+    finally:
+        reader.cancel()
+        with contextlib.suppress(asyncio.CancelledError, Exception):
+            await reader
+
+
+async def _dispatch_responses(
+    adapter: TransportAdapter,
+    pending: dict[str | int | None, asyncio.Future[SessionMessage]],
+) -> None:
+    """Route server messages to the futures awaiting their JSON-RPC ids.
+
+    Runs until the adapter read fails, then fails every pending future
+    with that error and re-raises it.
+
+    Args:
+        adapter: The server adapter to read from.
+        pending: Outstanding request futures keyed by JSON-RPC id.
+    """
+    try:
+        while True:
+            response = await adapter.read()
+            future = pending.pop(extract_jsonrpc_id(response.message), None)
+            if future is not None and not future.done():
+                future.set_result(response)
+            # Unmatched messages (e.g. server notifications) are skipped
+    except Exception as exc:
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(exc)
+        pending.clear()
+        raise
+
+
 async def _read_response(
     adapter: TransportAdapter,
     expected_id: str | int | None,
@@ -6,14 +6,29 @@ via the ProxySession Pydantic model.
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+import orjson
 from mcp.types import JSONRPCMessage
 
 from mcp_proxy.models import Direction, ProxyMessage, ProxySession, Transport
 
+# Serialized value -> enum member, looked up once per loaded message
+_DIRECTIONS: dict[str, Direction] = {d.value: d for d in Direction}
+_TRANSPORTS: dict[str, Transport] = {t.value: t for t in Transport}
+
+# A message with its raw, modified and original_raw as read for one save
+_SavedMessage = tuple[ProxyMessage, JSONRPCMessage, bool, JSONRPCMessage | None]
+# The same three fields followed by the entry's encoded bytes
+_EncodedEntry = tuple[JSONRPCMessage, bool, JSONRPCMessage | None, bytes]
+
+# Bound once; save() calls it for every new message
+_to_json = JSONRPCMessage.__pydantic_serializer__.to_json
+
 
 class SessionStore:
     """In-memory capture of all proxied messages in a session.
@@ -48,6 +63,12 @@ class SessionStore:
         self.started_at = started_at or datetime.now(tz=UTC)
         self._messages: list[ProxyMessage] = []
         self._index: dict[str, ProxyMessage] = {}
+        # Encoded save_async() entry per proxy id, tagged with the raw,
+        # modified and original_raw it was built from; a MODIFY changes all
+        # three, which invalidates it
+        self._encoded: dict[str, _EncodedEntry] = {}
+        # Serializes save_async() calls so concurrent saves run in order
+        self._save_lock = asyncio.Lock()
 
     def append(self, message: ProxyMessage) -> None:
         """Add a message to the session capture.
@@ -83,26 +104,15 @@ class SessionStore:
         Returns:
             A ProxySession containing all captured messages.
         """
-        serialized_messages: list[dict[str, Any]] = []
-        for msg in self._messages:
-            entry: dict[str, Any] = {
-                "proxy_id": msg.id,
-                "sequence": msg.sequence,
-                "timestamp": msg.timestamp.isoformat(),
-                "direction": msg.direction.value,
-                "transport": msg.transport.value,
-                "jsonrpc_id": msg.jsonrpc_id,
-                "method": msg.method,
-                "correlated_id": msg.correlated_id,
-                "modified": msg.modified,
-                "payload": msg.raw.model_dump(by_alias=True, exclude_none=True),
-            }
-            if msg.original_raw is not None:
-                entry["original_payload"] = msg.original_raw.model_dump(
-                    by_alias=True, exclude_none=True
-                )
-            serialized_messages.append(entry)
+        return self._session_header(
+            [
+                _serialize_message(msg, msg.raw, msg.modified, msg.original_raw)
+                for msg in self._messages
+            ]
+        )
 
+    def _session_header(self, messages: list[dict[str, Any]]) -> ProxySession:
+        """Build the ProxySession for this store around the given entries."""
         return ProxySession(
             id=self.session_id,
             started_at=self.started_at,
@@ -110,20 +120,101 @@ class SessionStore:
             transport=self.transport,
             server_command=self.server_command,
             server_url=self.server_url,
-            messages=serialized_messages,
+            messages=messages,
             metadata=self.metadata,
         )
 
     def save(self, path: Path) -> None:
         """Save the session to a JSON file.
 
+        Messages are serialized and written one at a time, so saving does
+        not hold a second full copy of the session in memory. The layout
+        matches ``to_proxy_session().model_dump_json(indent=2)``.
+
+        Args:
+            path: File path to write. Parent directories are created
+                if they do not exist.
+        """
+        self._write(path, *self._snapshot(), encoded=None)
+
+    async def save_async(self, path: Path) -> None:
+        """Save the session to a JSON file without blocking the event loop.
+
+        Serialization and the file write run in a worker thread, so proxied
+        traffic keeps flowing during large saves. Saves started while one
+        is running wait for it and then run in call order.
+
+        Meant for repeated saves such as autosave: each entry's encoding is
+        kept on the store, so later saves only serialize messages captured
+        (or modified) since. That costs memory about the size of the saved
+        file for the life of the store; use save() for one-off writes.
+
         Args:
             path: File path to write. Parent directories are created
                 if they do not exist.
         """
+        async with self._save_lock:
+            # Taken on the loop: the pipeline modifies messages there, one
+            # field at a time, while the thread is writing
+            header, messages = self._snapshot()
+            await asyncio.to_thread(self._write, path, header, messages, self._encoded)
+
+    def _snapshot(self) -> tuple[bytes, list[_SavedMessage]]:
+        """Capture the encoded header and the mutable message fields to save."""
+        # The header is small, so Pydantic writes it exactly as
+        # model_dump_json would, including metadata orjson cannot encode
+        header = self._session_header([]).model_dump_json(indent=2).encode()
+        messages = [(msg, msg.raw, msg.modified, msg.original_raw) for msg in self._messages]
+        return header, messages
+
+    def _write(
+        self,
+        path: Path,
+        header: bytes,
+        messages: list[_SavedMessage],
+        encoded: dict[str, _EncodedEntry] | None,
+    ) -> None:
+        """Write a snapshot taken by _snapshot() to path.
+
+        Entries are reused from and stored in ``encoded`` when it is given;
+        with None each entry is encoded, written and dropped.
+        """
         path.parent.mkdir(parents=True, exist_ok=True)
-        session = self.to_proxy_session()
-        path.write_text(session.model_dump_json(indent=2), encoding="utf-8")
+        messages_key = b'\n  "messages": '
+        head, tail = header.split(messages_key)
+        with path.open("wb") as f:
+            f.write(head)
+            if not messages:
+                f.write(messages_key + tail)
+                return
+            f.write(messages_key + b"[")
+            separator = b"\n    "
+            for msg, raw, modified, original_raw in messages:
+                cached = encoded.get(msg.id) if encoded is not None else None
+                if (
+                    cached is not None
+                    and cached[0] is raw
+                    and cached[1] == modified
+                    and cached[2] is original_raw
+                ):
+                    entry = cached[3]
+                else:
+                    # Re-indent one level for nesting inside "messages"; JSON
+                    # strings never contain raw newlines
+                    fields = _serialize_message(msg, raw, modified, original_raw, _payload_fragment)
+                    if type(msg.jsonrpc_id) is int:
+                        # Ids come from the peer and may exceed orjson's 64-bit range
+                        fields["jsonrpc_id"] = orjson.Fragment(b"%d" % msg.jsonrpc_id)
+                    entry = orjson.dumps(fields, option=orjson.OPT_INDENT_2).replace(
+                        b"\n", b"\n    "
+                    )
+                    if encoded is not None:
+                        encoded[msg.id] = (raw, modified, original_raw, entry)
+                f.write(separator)
+                f.write(entry)
+                separator = b",\n    "
+            # tail starts with the empty list placeholder "[]"
+            f.write(b"\n  ]" + tail.removeprefix(b"[]"))
 
     @classmethod
     def load(cls, path: Path) -> SessionStore:
@@ -135,8 +226,9 @@ class SessionStore:
         Returns:
             A SessionStore reconstructed from the saved session.
         """
-        json_text = path.read_text(encoding="utf-8")
-        session = ProxySession.model_validate_json(json_text)
+        # Pydantic parses the bytes directly and keeps integers wider than
+        # 64 bits exact, where orjson.loads would turn them into floats
+        session = ProxySession.model_validate_json(path.read_bytes())
         store = cls(
             session_id=session.id,
             transport=session.transport,
@@ -145,23 +237,80 @@ class SessionStore:
             metadata=session.metadata,
             started_at=session.started_at,
         )
+        # Bound once; large sessions run this loop per message
+        validate = JSONRPCMessage.model_validate
+        parse_timestamp = datetime.fromisoformat
+        messages = store._messages
+        index = store._index
         for entry in session.messages:
-            raw = JSONRPCMessage.model_validate(entry["payload"])
-            original_raw = None
-            if "original_payload" in entry:
-                original_raw = JSONRPCMessage.model_validate(entry["original_payload"])
+            original_payload = entry.get("original_payload")
             msg = ProxyMessage(
                 id=entry["proxy_id"],
                 sequence=entry["sequence"],
-                timestamp=datetime.fromisoformat(entry["timestamp"]),
-                direction=Direction(entry["direction"]),
-                transport=Transport(entry["transport"]),
-                raw=raw,
+                timestamp=parse_timestamp(entry["timestamp"]),
+                direction=_DIRECTIONS[entry["direction"]],
+                transport=_TRANSPORTS[entry["transport"]],
+                raw=validate(entry["payload"]),
                 jsonrpc_id=entry.get("jsonrpc_id"),
                 method=entry.get("method"),
                 correlated_id=entry.get("correlated_id"),
                 modified=entry.get("modified", False),
-                original_raw=original_raw,
+                original_raw=None if original_payload is None else validate(original_payload),
             )
-            store.append(msg)
+            messages.append(msg)
+            index[msg.id] = msg
         return store
+
+
+def _payload_dict(message: JSONRPCMessage) -> dict[str, Any]:
+    """Dump a payload as the dict stored in a ProxySession entry."""
+    payload: dict[str, Any] = message.model_dump(by_alias=True, exclude_none=True)
+    return payload
+
+
+def _payload_fragment(message: JSONRPCMessage) -> orjson.Fragment:
+    """Encode a payload for a save() entry through Pydantic.
+
+    Payloads are arbitrary JSON from the peer and may hold integers wider
+    than orjson's 64-bit range, which Pydantic encodes. orjson writes a
+    Fragment verbatim, so its lines are indented to the payload's depth.
+    """
+    encoded = _to_json(message, indent=2, by_alias=True, exclude_none=True)
+    return orjson.Fragment(encoded.replace(b"\n", b"\n  "))
+
+
+def _serialize_message(
+    msg: ProxyMessage,
+    raw: JSONRPCMessage,
+    modified: bool,
+    original_raw: JSONRPCMessage | None,
+    dump_payload: Callable[[JSONRPCMessage], Any] = _payload_dict,
+) -> dict[str, Any]:
+    """Build the saved-session entry for one message.
+
+    Args:
+        msg: The proxy message to serialize.
+        raw: The message's payload; passed separately so a save can use
+            the values it read on the event loop.
+        modified: The message's modified flag.
+        original_raw: The message's pre-modification payload, if any.
+        dump_payload: Converts ``payload`` and ``original_payload``.
+
+    Returns:
+        A dict in the ProxySession message format.
+    """
+    entry: dict[str, Any] = {
+        "proxy_id": msg.id,
+        "sequence": msg.sequence,
+        "timestamp": msg.timestamp.isoformat(),
+        "direction": msg.direction.value,
+        "transport": msg.transport.value,
+        "jsonrpc_id": msg.jsonrpc_id,
+        "method": msg.method,
+        "correlated_id": msg.correlated_id,
+        "modified": modified,
+        "payload": dump_payload(raw),
+    }
+    if original_raw is not None:
+        entry["original_payload"] = dump_payload(original_raw)
+    return entry
@@ -6,18 +6,20 @@ as a background worker, and wires pipeline callbacks to widget updates.
 
 from __future__ import annotations
 
-import json
 import logging
 import shlex
 import uuid
+from functools import partial
 from pathlib import Path
 
 from mcp.shared.message import SessionMessage
 from mcp.types import JSONRPCMessage
+from pydantic import ValidationError
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal
 from textual.css.query import NoMatches
+from textual.timer import Timer
 from textual.widgets import Footer, Header, Input
 from textual.worker import Worker
 
@@ -39,6 +41,7 @@ from mcp_proxy.tui.messages import (
     MessageForwarded,
     MessageHeld,
     MessageReceived,
+    MessagesReceived,
     PipelineError,
     PipelineStopped,
     ReplayCompleted,
@@ -49,6 +52,11 @@ from mcp_proxy.tui.widgets.status_bar import ProxyStatusBar
 
 logger = logging.getLogger(__name__)
 
+# Seconds between detail panel renders while the selection keeps changing
+_SELECTION_INTERVAL = 0.05
+# Seconds of typing pause before the message filter is re-applied
+_FILTER_DELAY = 0.12
+
 
 class ProxyApp(App[None]):
     """Textual application for interactive MCP traffic inspection.
@@ -99,6 +107,21 @@ class ProxyApp(App[None]):
         self._run_pipeline_on_mount = run_pipeline_on_mount
         self._pipeline_worker: Worker[None] | None = None
 
+        # Captured messages awaiting the pending MessagesReceived event
+        self._inbox: list[ProxyMessage] = []
+
+        # Main widgets, resolved in on_mount
+        self._list_panel: MessageListPanel
+        self._detail_panel: MessageDetailPanel
+        self._status_bar: ProxyStatusBar
+
+        # Detail panel throttling for rapid selection changes
+        self._selection_throttled: bool = False
+        self._pending_selection: ProxyMessage | None = None
+
+        # Pending filter application while the user is still typing
+        self._filter_timer: Timer | None = None
+
         # Edit mode state
         self._editing: bool = False
         self._editing_held: HeldMessage | None = None
@@ -131,8 +154,11 @@ class ProxyApp(App[None]):
         yield Footer()
 
     def on_mount(self) -> None:
-        """Start the pipeline worker on mount if configured."""
-        bar = self.query_one(ProxyStatusBar)
+        """Resolve the main widgets and start the pipeline worker if configured."""
+        # Looked up once here; handlers run per message and reuse them
+        self._list_panel = self.query_one(MessageListPanel)
+        self._detail_panel = self.query_one(MessageDetailPanel)
+        self._status_bar = bar = self.query_one(ProxyStatusBar)
         bar.mode = self.intercept_engine.mode
         if self._run_pipeline_on_mount:
             self._launch_pipeline()
@@ -238,13 +264,25 @@ class ProxyApp(App[None]):
     # ------------------------------------------------------------------
 
     def _on_pipeline_message(self, pm: ProxyMessage) -> None:
-        self.post_message(MessageReceived(pm))
+        # One event per burst: later messages join the list already posted
+        if self._inbox:
+            self._inbox.append(pm)
+            return
+        inbox = [pm]
+        # A rejected post (app closing) leaves the inbox empty so the next
+        # message posts again instead of joining a list nobody will read
+        if self.post_message(MessagesReceived(inbox)):
+            self._inbox = inbox
 
     def _on_pipeline_held(self, held: HeldMessage) -> None:
         self.post_message(MessageHeld(held))
 
     def _on_pipeline_forwarded(self, pm: ProxyMessage) -> None:
-        self.post_message(MessageForwarded(pm))
+        # Nothing is held in passthrough (set_mode releases all and the toggle
+        # action refreshes the bar), so the event would only repaint the same
+        # held count for every forwarded message
+        if self.intercept_engine.mode == InterceptMode.INTERCEPT:
+            self.post_message(MessageForwarded(pm))
 
     # ------------------------------------------------------------------
     # Message handlers
@@ -256,9 +294,22 @@ class ProxyApp(App[None]):
         Args:
             event: The MessageReceived event containing the ProxyMessage.
         """
-        panel = self.query_one(MessageListPanel)
+        panel = self._list_panel
         panel.add_message(event.proxy_message)
-        bar = self.query_one(ProxyStatusBar)
+        bar = self._status_bar
+        bar.message_count = len(panel.messages)
+
+    def on_messages_received(self, event: MessagesReceived) -> None:
+        """Handle a burst of new messages from the pipeline.
+
+        Args:
+            event: The MessagesReceived event containing the ProxyMessages.
+        """
+        # Messages captured from here on start a new batch
+        self._inbox = []
+        panel = self._list_panel
+        panel.add_messages(event.proxy_messages)
+        bar = self._status_bar
         bar.message_count = len(panel.messages)
 
     def on_message_held(self, event: MessageHeld) -> None:
@@ -267,10 +318,10 @@ class ProxyApp(App[None]):
         Args:
             event: The MessageHeld event containing the HeldMessage.
         """
-        panel = self.query_one(MessageListPanel)
+        panel = self._list_panel
         panel.mark_held(event.held_message.proxy_message.id)
-        bar = self.query_one(ProxyStatusBar)
-        bar.held_count = len(self.intercept_engine.get_held())
+        bar = self._status_bar
+        bar.held_count = self.intercept_engine.held_count
 
     def on_message_forwarded(self, event: MessageForwarded) -> None:
         """Handle a forwarded message notification.
@@ -278,17 +329,41 @@ class ProxyApp(App[None]):
         Args:
             event: The MessageForwarded event.
         """
-        bar = self.query_one(ProxyStatusBar)
-        bar.held_count = len(self.intercept_engine.get_held())
+        bar = self._status_bar
+        bar.held_count = self.intercept_engine.held_count
 
     def on_message_selected(self, event: MessageSelected) -> None:
         """Handle message selection -- update detail panel.
 
+        The first selection renders at once. Selections arriving within
+        the following interval (arrow-key auto-repeat) only record the
+        latest message, which is rendered when the interval ends.
+
         Args:
             event: The MessageSelected event from the list panel.
         """
-        detail = self.query_one(MessageDetailPanel)
-        detail.show_message(event.proxy_message)
+        if self._selection_throttled:
+            self._pending_selection = event.proxy_message
+            return
+        self._show_selection(event.proxy_message)
+
+    def _show_selection(self, proxy_message: ProxyMessage) -> None:
+        """Render a message in the detail panel and open a throttle interval.
+
+        Args:
+            proxy_message: The selected message.
+        """
+        self._detail_panel.show_message(proxy_message)
+        self._selection_throttled = True
+        self.set_timer(_SELECTION_INTERVAL, self._end_selection_interval)
+
+    def _end_selection_interval(self) -> None:
+        """Render the latest selection made during the interval, if any."""
+        self._selection_throttled = False
+        pending = self._pending_selection
+        if pending is not None:
+            self._pending_selection = None
+            self._show_selection(pending)
 
     def on_pipeline_error(self, event: PipelineError) -> None:
         """Handle pipeline error -- update status bar.
@@ -296,7 +371,7 @@ class ProxyApp(App[None]):
         Args:
             event: The PipelineError event.
         """
-        bar = self.query_one(ProxyStatusBar)
+        bar = self._status_bar
         bar.connection_status = f"ERROR: {event.error}"
 
     def on_pipeline_stopped(self, event: PipelineStopped) -> None:
@@ -305,7 +380,7 @@ class ProxyApp(App[None]):
         Args:
             event: The PipelineStopped event.
         """
-        bar = self.query_one(ProxyStatusBar)
+        bar = self._status_bar
         bar.connection_status = "DISCONNECTED"
 
     def on_replay_completed(self, event: ReplayCompleted) -> None:
@@ -314,7 +389,9 @@ class ProxyApp(App[None]):
         Args:
             event: The ReplayCompleted event with results.
         """
-        detail = self.query_one(MessageDetailPanel)
+        # The diff replaces the detail view; drop a selection still pending
+        self._pending_selection = None
+        detail = self._detail_panel
         detail.show_replay_diff(event.original_response, event.result)
 
         result = event.result
@@ -333,14 +410,11 @@ class ProxyApp(App[None]):
         Returns:
             The matching HeldMessage, or None if no selection or not held.
         """
-        panel = self.query_one(MessageListPanel)
+        panel = self._list_panel
         pm = panel.get_selected_message()
         if pm is None:
             return None
-        for held in self.intercept_engine.get_held():
-            if held.proxy_message.id == pm.id:
-                return held
-        return None
+        return self.intercept_engine.get_held_by_id(pm.id)
 
     def action_toggle_intercept(self) -> None:
         """Toggle between PASSTHROUGH and INTERCEPT modes."""
@@ -348,9 +422,9 @@ class ProxyApp(App[None]):
             self.intercept_engine.set_mode(InterceptMode.INTERCEPT)
         else:
             self.intercept_engine.set_mode(InterceptMode.PASSTHROUGH)
-        bar = self.query_one(ProxyStatusBar)
+        bar = self._status_bar
         bar.mode = self.intercept_engine.mode
-        bar.held_count = len(self.intercept_engine.get_held())
+        bar.held_count = self.intercept_engine.held_count
 
     def action_forward(self) -> None:
         """Forward the selected held message."""
@@ -360,10 +434,10 @@ class ProxyApp(App[None]):
         if held is None:
             return
         self.intercept_engine.release(held, InterceptAction.FORWARD)
-        panel = self.query_one(MessageListPanel)
+        panel = self._list_panel
         panel.mark_forwarded(held.proxy_message.id)
-        bar = self.query_one(ProxyStatusBar)
-        bar.held_count = len(self.intercept_engine.get_held())
+        bar = self._status_bar
+        bar.held_count = self.intercept_engine.held_count
 
     def action_drop(self) -> None:
         """Drop the selected held message."""
@@ -373,10 +447,10 @@ class ProxyApp(App[None]):
         if held is None:
             return
         self.intercept_engine.release(held, InterceptAction.DROP)
-        panel = self.query_one(MessageListPanel)
+        panel = self._list_panel
         panel.mark_dropped(held.proxy_message.id)
-        bar = self.query_one(ProxyStatusBar)
-        bar.held_count = len(self.intercept_engine.get_held())
+        bar = self._status_bar
+        bar.held_count = self.intercept_engine.held_count
 
     def action_modify(self) -> None:
         """Enter edit mode for the selected held message."""
@@ -387,20 +461,20 @@ class ProxyApp(App[None]):
             return
         self._editing = True
         self._editing_held = held
-        detail = self.query_one(MessageDetailPanel)
+        detail = self._detail_panel
         detail.enter_edit_mode(held.proxy_message)
 
     def action_confirm_modify(self) -> None:
         """Confirm the edit and release the held message with MODIFY action."""
         if not self._editing or self._editing_held is None:
             return
-        detail = self.query_one(MessageDetailPanel)
+        detail = self._detail_panel
         edited_text = detail.get_edited_text()
 
         try:
-            parsed = json.loads(edited_text)
-            modified_raw = JSONRPCMessage.model_validate(parsed)
-        except (json.JSONDecodeError, Exception) as exc:
+            # Parses and validates in one pass; bad JSON is a ValidationError too
+            modified_raw = JSONRPCMessage.model_validate_json(edited_text)
+        except ValidationError as exc:
             self.notify(f"Invalid JSON: {exc}", severity="error")
             return
 
@@ -410,26 +484,26 @@ class ProxyApp(App[None]):
         self._editing = False
         self._editing_held = None
 
-        panel = self.query_one(MessageListPanel)
+        panel = self._list_panel
         panel.mark_forwarded(held.proxy_message.id)
-        bar = self.query_one(ProxyStatusBar)
-        bar.held_count = len(self.intercept_engine.get_held())
+        bar = self._status_bar
+        bar.held_count = self.intercept_engine.held_count
 
     def action_cancel_modify(self) -> None:
         """Cancel the edit and forward the held message as-is."""
         if not self._editing or self._editing_held is None:
             return
         held = self._editing_held
-        detail = self.query_one(MessageDetailPanel)
+        detail = self._detail_panel
         detail.exit_edit_mode()
         self._editing = False
         self._editing_held = None
 
         self.intercept_engine.release(held, InterceptAction.FORWARD)
-        panel = self.query_one(MessageListPanel)
+        panel = self._list_panel
         panel.mark_forwarded(held.proxy_message.id)
-        bar = self.query_one(ProxyStatusBar)
-        bar.held_count = len(self.intercept_engine.get_held())
+        bar = self._status_bar
+        bar.held_count = self.intercept_engine.held_count
 
     def action_focus_filter(self) -> None:
         """Focus the message filter input."""
@@ -450,7 +524,7 @@ class ProxyApp(App[None]):
             self.notify("Replay requires stdio transport", severity="warning")
             return
 
-        panel = self.query_one(MessageListPanel)
+        panel = self._list_panel
         selected = panel.get_selected_message()
         if selected is None:
             return
@@ -567,22 +641,36 @@ class ProxyApp(App[None]):
     def on_input_changed(self, event: Input.Changed) -> None:
         """Handle filter input changes for live filtering.
 
+        The filter is applied once typing pauses for ``_FILTER_DELAY``.
+
         Args:
             event: The Input.Changed event.
         """
         if event.input.id != "filter-input":
             return
-        panel = self.query_one(MessageListPanel)
-        panel.set_filter(event.value)
+        # Restart the delay on each keystroke so a typed word filters once
+        if self._filter_timer is not None:
+            self._filter_timer.stop()
+        self._filter_timer = self.set_timer(
+            _FILTER_DELAY, partial(self._list_panel.set_filter, event.value)
+        )
 
     def _do_save(self, path: Path) -> None:
-        """Save the session store to the given path.
+        """Save the session store to the given path in a background worker.
+
+        Args:
+            path: File path to write.
+        """
+        self.run_worker(self._save_worker(path), name="save")
+
+    async def _save_worker(self, path: Path) -> None:
+        """Write the session off the event loop and report the outcome.
 
         Args:
             path: File path to write.
         """
         try:
-            self.session_store.save(path)
+            await self.session_store.save_async(path)
             self.notify(f"Session saved to {path}")
         except Exception as exc:
             self.notify(f"Save failed: {exc}", severity="error")
@@ -20,11 +20,30 @@ class MessageReceived(Message):
         proxy_message: The wrapped ProxyMessage with metadata.
     """
 
+    __slots__ = ("proxy_message",)
+
     def __init__(self, proxy_message: ProxyMessage) -> None:
         super().__init__()
         self.proxy_message = proxy_message
 
 
+class MessagesReceived(Message):
+    """One or more JSON-RPC messages were captured by the pipeline.
+
+    The app posts one of these per burst rather than one per message;
+    the list keeps growing until the app handles the event.
+
+    Args:
+        proxy_messages: The wrapped ProxyMessages, in capture order.
+    """
+
+    __slots__ = ("proxy_messages",)
+
+    def __init__(self, proxy_messages: list[ProxyMessage]) -> None:
+        super().__init__()
+        self.proxy_messages = proxy_messages
+
+
 class MessageHeld(Message):
     """A message was held by the intercept engine for user action.
 
@@ -32,6 +51,8 @@ class MessageHeld(Message):
         held_message: The HeldMessage awaiting forward/modify/drop.
     """
 
+    __slots__ = ("held_message",)
+
     def __init__(self, held_message: HeldMessage) -> None:
         super().__init__()
         self.held_message = held_message
@@ -44,6 +65,8 @@ class MessageForwarded(Message):
         proxy_message: The forwarded ProxyMessage (may be modified).
     """
 
+    __slots__ = ("proxy_message",)
+
     def __init__(self, proxy_message: ProxyMessage) -> None:
         super().__init__()
         self.proxy_message = proxy_message
@@ -56,6 +79,8 @@ class PipelineError(Message):
         error: The exception that occurred.
     """
 
+    __slots__ = ("error",)
+
     def __init__(self, error: Exception) -> None:
         super().__init__()
         self.error = error
@@ -64,6 +89,8 @@ class PipelineError(Message):
 class PipelineStopped(Message):
     """The pipeline has stopped (adapters disconnected)."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__()
 
@@ -77,6 +104,8 @@ class ReplayCompleted(Message):
             (None if no correlated response was found).
     """
 
+    __slots__ = ("result", "original_response")
+
     def __init__(self, result: ReplayResult, original_response: ProxyMessage | None) -> None:
         super().__init__()
         self.result = result
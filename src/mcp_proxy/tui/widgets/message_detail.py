@@ -6,8 +6,7 @@ message. Supports read-only viewing via RichLog and edit mode via TextArea.
 
 from __future__ import annotations
 
-import json
-
+from mcp.types import JSONRPCMessage
 from textual.app import ComposeResult
 from textual.widget import Widget
 from textual.widgets import RichLog, TextArea
@@ -15,6 +14,8 @@ from textual.widgets import RichLog, TextArea
 from mcp_proxy.models import ProxyMessage
 from mcp_proxy.replay import ReplayResult
 
+_to_json = JSONRPCMessage.__pydantic_serializer__.to_json
+
 
 class MessageDetailPanel(Widget):
     """Right-side panel showing JSON-RPC payload and metadata.
@@ -41,11 +42,17 @@ class MessageDetailPanel(Widget):
         super().__init__()
         self._current_message: ProxyMessage | None = None
         self._editing: bool = False
+        # Child widgets, kept so handlers skip a selector query per event
+        self._log = RichLog(id="detail-log")
+        self._editor = TextArea(id="detail-editor", classes="hidden")
+        # Last payload shown and its formatted text, so entering edit mode
+        # on the displayed message does not format it a second time
+        self._formatted: tuple[JSONRPCMessage, str] | None = None
 
     def compose(self) -> ComposeResult:
         """Compose the widget with a RichLog viewer and hidden TextArea editor."""
-        yield RichLog(id="detail-log")
-        yield TextArea(id="detail-editor", classes="hidden")
+        yield self._log
+        yield self._editor
 
     @property
     def is_editing(self) -> bool:
@@ -59,27 +66,28 @@ class MessageDetailPanel(Widget):
             proxy_message: The message to display.
         """
         self._current_message = proxy_message
-        log = self.query_one("#detail-log", RichLog)
+        log = self._log
         log.clear()
 
         # Metadata header
-        log.write(f"--- Message #{proxy_message.sequence} ---")
-        log.write(f"Direction: {proxy_message.direction.value}")
-        log.write(f"Timestamp: {proxy_message.timestamp.isoformat()}")
+        lines = [
+            f"--- Message #{proxy_message.sequence} ---",
+            f"Direction: {proxy_message.direction.value}",
+            f"Timestamp: {proxy_message.timestamp.isoformat()}",
+        ]
         if proxy_message.method:
-            log.write(f"Method: {proxy_message.method}")
+            lines.append(f"Method: {proxy_message.method}")
         if proxy_message.jsonrpc_id is not None:
-            log.write(f"JSON-RPC ID: {proxy_message.jsonrpc_id}")
+            lines.append(f"JSON-RPC ID: {proxy_message.jsonrpc_id}")
         if proxy_message.correlated_id:
-            log.write(f"Correlated to: {proxy_message.correlated_id}")
+            lines.append(f"Correlated to: {proxy_message.correlated_id}")
         if proxy_message.modified:
-            log.write("[Modified]")
-        log.write("")
+            lines.append("[Modified]")
+        lines.append("")
 
-        # JSON payload
-        payload = proxy_message.raw.model_dump(by_alias=True, exclude_none=True)
-        formatted = json.dumps(payload, indent=2)
-        log.write(formatted)
+        # JSON payload; written with the header as one RichLog entry
+        lines.append(self._payload_text(proxy_message.raw))
+        log.write("\n".join(lines))
 
     def enter_edit_mode(self, proxy_message: ProxyMessage) -> None:
         """Switch to edit mode with the message payload in a TextArea.
@@ -90,14 +98,14 @@ class MessageDetailPanel(Widget):
         self._current_message = proxy_message
         self._editing = True
 
-        payload = proxy_message.raw.model_dump(by_alias=True, exclude_none=True)
-        formatted = json.dumps(payload, indent=2)
-
-        editor = self.query_one("#detail-editor", TextArea)
-        editor.text = formatted
+        editor = self._editor
+        formatted = self._payload_text(proxy_message.raw)
+        # Reopening an unedited message skips the TextArea document rebuild
+        if editor.text != formatted:
+            editor.text = formatted
 
         # Toggle visibility
-        self.query_one("#detail-log", RichLog).add_class("hidden")
+        self._log.add_class("hidden")
         editor.remove_class("hidden")
         editor.focus()
 
@@ -106,8 +114,8 @@ class MessageDetailPanel(Widget):
         self._editing = False
 
         # Toggle visibility
-        self.query_one("#detail-editor", TextArea).add_class("hidden")
-        self.query_one("#detail-log", RichLog).remove_class("hidden")
+        self._editor.add_class("hidden")
+        self._log.remove_class("hidden")
 
     def get_edited_text(self) -> str:
         """Return the current content of the TextArea editor.
@@ -115,7 +123,22 @@ class MessageDetailPanel(Widget):
         Returns:
             The edited JSON text.
         """
-        text: str = self.query_one("#detail-editor", TextArea).text
+        text: str = self._editor.text
+        return text
+
+    def _payload_text(self, message: JSONRPCMessage) -> str:
+        """Return the formatted payload, reusing the last one shown if unchanged.
+
+        Args:
+            message: The message to format.
+
+        Returns:
+            The payload as two-space indented JSON.
+        """
+        if self._formatted is not None and self._formatted[0] is message:
+            return self._formatted[1]
+        text = _format_payload(message)
+        self._formatted = (message, text)
         return text
 
     def show_replay_diff(
@@ -132,25 +155,35 @@ class MessageDetailPanel(Widget):
         if self._editing:
             self.exit_edit_mode()
 
-        log = self.query_one("#detail-log", RichLog)
+        log = self._log
         log.clear()
 
         if original_response is not None:
             log.write("--- ORIGINAL RESPONSE ---")
-            payload = original_response.raw.model_dump(by_alias=True, exclude_none=True)
-            log.write(json.dumps(payload, indent=2))
+            log.write(_format_payload(original_response.raw))
             log.write("")
 
         log.write("--- REPLAY RESPONSE ---")
         if replay_result.error:
             log.write(f"ERROR: {replay_result.error}")
         elif replay_result.response is not None:
-            payload = replay_result.response.message.model_dump(
-                by_alias=True, exclude_none=True
-            )
-            log.write(json.dumps(payload, indent=2))
+            log.write(_format_payload(replay_result.response.message))
         else:
             log.write("(no response)")
 
         log.write("")
         log.write(f"Duration: {replay_result.duration_ms:.1f}ms")
+
+
+def _format_payload(message: JSONRPCMessage) -> str:
+    """Pretty-print a JSON-RPC message for display or editing.
+
+    Args:
+        message: The message to format.
+
+    Returns:
+        The payload as two-space indented JSON.
+    """
+    # Pydantic encodes straight from the model, including integers wider
+    # than the 64 bits orjson accepts
+    return _to_json(message, indent=2, by_alias=True, exclude_none=True).decode()
@@ -8,9 +8,9 @@ from __future__ import annotations
 
 import json
 
+from mcp.types import JSONRPCMessage
 from textual.app import ComposeResult
 from textual.binding import Binding
-from textual.css.query import NoMatches
 from textual.message import Message
 from textual.widget import Widget
 from textual.widgets import Input, ListItem, ListView, Static
@@ -57,14 +57,22 @@ class MessageListPanel(Widget):
     def __init__(self) -> None:
         super().__init__()
         self.messages: list[ProxyMessage] = []
+        # Same messages keyed by proxy id, for selection and label updates
+        self._by_id: dict[str, ProxyMessage] = {}
+        # Child widgets, kept so handlers skip a selector query per event
+        self._items: dict[str, ListItem] = {}
+        self._list_view = ListView()
         self._held_ids: set[str] = set()
         self._dropped_ids: set[str] = set()
         self._active_filter: str = ""
+        # Filter search text per proxy id, tagged with the raw message it
+        # was built from
+        self._search_cache: dict[str, tuple[JSONRPCMessage, str]] = {}
 
     def compose(self) -> ComposeResult:
         """Compose the widget with a filter Input and ListView."""
         yield Input(placeholder="Filter (> client, < server)...", id="filter-input")
-        yield ListView()
+        yield self._list_view
 
     def add_message(self, proxy_message: ProxyMessage) -> None:
         """Add a new message to the list.
@@ -74,14 +82,30 @@ class MessageListPanel(Widget):
         Args:
             proxy_message: The message to add.
         """
-        self.messages.append(proxy_message)
-        label = self._format_label(proxy_message)
-        item = ListItem(Static(label), id=f"msg-{proxy_message.id}")
-        if self._active_filter and not self._matches_filter(
-            proxy_message, self._active_filter
-        ):
-            item.add_class("hidden")
-        self.query_one(ListView).append(item)
+        self.add_messages([proxy_message])
+
+    def add_messages(self, proxy_messages: list[ProxyMessage]) -> None:
+        """Add several messages to the list in one ListView update.
+
+        Respects the active filter — non-matching messages are added hidden.
+
+        Args:
+            proxy_messages: The messages to add, in order.
+        """
+        items = []
+        for proxy_message in proxy_messages:
+            label = self._format_label(proxy_message)
+            item = ListItem(Static(label), id=f"msg-{proxy_message.id}")
+            if self._active_filter and not self._matches_filter(
+                proxy_message, self._active_filter
+            ):
+                item.add_class("hidden")
+            items.append(item)
+            self._items[proxy_message.id] = item
+        self.messages.extend(proxy_messages)
+        for proxy_message in proxy_messages:
+            self._by_id[proxy_message.id] = proxy_message
+        self._list_view.extend(items)
 
     def mark_held(self, proxy_id: str) -> None:
         """Mark a message as held (show pause icon).
@@ -117,17 +141,13 @@ class MessageListPanel(Widget):
         Returns:
             The selected ProxyMessage, or None if nothing is highlighted.
         """
-        list_view = self.query_one(ListView)
+        list_view = self._list_view
         if list_view.highlighted_child is None:
             return None
         item_id = list_view.highlighted_child.id
         if item_id is None:
             return None
-        proxy_id = item_id.removeprefix("msg-")
-        for pm in self.messages:
-            if pm.id == proxy_id:
-                return pm
-        return None
+        return self._by_id.get(item_id.removeprefix("msg-"))
 
     def _update_item_label(self, proxy_id: str) -> None:
         """Re-render the label for a message item.
@@ -135,15 +155,11 @@ class MessageListPanel(Widget):
         Args:
             proxy_id: The ProxyMessage.id to update.
         """
-        for pm in self.messages:
-            if pm.id == proxy_id:
-                try:
-                    item = self.query_one(f"#msg-{proxy_id}", ListItem)
-                    label = self._format_label(pm)
-                    item.query_one(Static).update(label)
-                except NoMatches:
-                    pass
-                break
+        pm = self._by_id.get(proxy_id)
+        item = self._items.get(proxy_id)
+        if pm is None or item is None:
+            return
+        item.query_one(Static).update(self._format_label(pm))
 
     def _format_label(self, pm: ProxyMessage, held: bool = False) -> str:
         """Format a single message line for display.
@@ -199,9 +215,28 @@ class MessageListPanel(Widget):
         if pm.method and text_lower in pm.method.lower():
             return True
 
+        return text_lower in self._search_text(pm)
+
+    def _search_text(self, pm: ProxyMessage) -> str:
+        """Return the lowercased serialized payload that filters match against.
+
+        Cached per message so each filter keystroke is a substring scan
+        rather than a re-serialization; a MODIFY swaps ``raw``, which
+        invalidates the entry.
+
+        Args:
+            pm: The ProxyMessage to serialize.
+
+        Returns:
+            The payload as lowercased JSON text.
+        """
+        cached = self._search_cache.get(pm.id)
+        if cached is not None and cached[0] is pm.raw:
+            return cached[1]
         payload = pm.raw.model_dump(by_alias=True, exclude_none=True)
         serialized = json.dumps(payload).lower()
-        return text_lower in serialized
+        self._search_cache[pm.id] = (pm.raw, serialized)
+        return serialized
 
     def set_filter(self, filter_text: str) -> None:
         """Apply a filter to the message list.
@@ -212,24 +247,23 @@ class MessageListPanel(Widget):
             filter_text: The filter string to apply.
         """
         self._active_filter = filter_text
-        list_view = self.query_one(ListView)
-        for pm in self.messages:
-            try:
-                item = list_view.query_one(f"#msg-{pm.id}", ListItem)
-            except NoMatches:
-                continue
-            if self._matches_filter(pm, filter_text):
-                item.remove_class("hidden")
-            else:
-                item.add_class("hidden")
+        by_id = self._by_id
+        # One walk over the list's items; batch_update repaints once at the end
+        with self.app.batch_update():
+            for item in self._list_view.children:
+                if item.id is None:
+                    continue
+                pm = by_id.get(item.id.removeprefix("msg-"))
+                if pm is not None:
+                    item.set_class(not self._matches_filter(pm, filter_text), "hidden")
 
     def on_mount(self) -> None:
         """Focus the ListView on mount so the filter input is not auto-focused."""
-        self.query_one(ListView).focus()
+        self._list_view.focus()
 
     def action_unfocus_filter(self) -> None:
         """Return focus from the filter input to the message list."""
-        self.query_one(ListView).focus()
+        self._list_view.focus()
 
     def on_list_view_highlighted(self, event: ListView.Highlighted) -> None:
         """Handle list item highlight -- fire MessageSelected.
@@ -243,8 +277,6 @@ class MessageListPanel(Widget):
         if item_id is None:
             return
         # Extract proxy_id from "msg-{uuid}"
-        proxy_id = item_id.removeprefix("msg-")
-        for pm in self.messages:
-            if pm.id == proxy_id:
-                self.post_message(MessageSelected(pm))
-                break
+        pm = self._by_id.get(item_id.removeprefix("msg-"))
+        if pm is not None:
+            self.post_message(MessageSelected(pm))
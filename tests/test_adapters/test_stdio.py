@@ -115,6 +115,59 @@ class TestStdioServerAdapterRead:
         assert result.message == msg.message
         assert "parse error" in caplog.text
 
+    async def test_read_at_end_of_stream_raises(self) -> None:
+        """read() raises RuntimeError once the SDK stream is exhausted."""
+
+        @asynccontextmanager
+        async def fake_stdio_client(*args: Any, **kwargs: Any):
+            async with _mock_stdio_streams() as (r, w):
+                yield r, w
+
+        with patch("mcp_proxy.adapters.stdio.stdio_client", fake_stdio_client):
+            async with StdioServerAdapter(command="fake", args=[]) as adapter:
+                try:
+                    await asyncio.wait_for(adapter.read(), timeout=0.5)
+                    raise AssertionError("Expected RuntimeError")  # noqa: TRY301
+                except RuntimeError:
+                    pass
+
+    async def test_read_many_drains_buffered_messages(self, caplog: Any) -> None:
+        """read_many() returns every message already buffered, skipping exceptions."""
+        msgs = [_make_session_message(msg_id=i) for i in range(3)]
+        err = RuntimeError("parse error")
+
+        @asynccontextmanager
+        async def fake_stdio_client(*args: Any, **kwargs: Any):
+            async with _mock_stdio_streams(inbound=[msgs[0], err, msgs[1], msgs[2]]) as (r, w):
+                yield r, w
+
+        with (
+            patch("mcp_proxy.adapters.stdio.stdio_client", fake_stdio_client),
+            caplog.at_level(logging.WARNING),
+        ):
+            async with StdioServerAdapter(command="fake", args=[]) as adapter:
+                batch = await adapter.read_many()
+
+        assert [m.message for m in batch] == [m.message for m in msgs]
+        assert "parse error" in caplog.text
+
+    async def test_read_many_respects_max_items(self) -> None:
+        """read_many() never returns more than max_items messages."""
+        msgs = [_make_session_message(msg_id=i) for i in range(3)]
+
+        @asynccontextmanager
+        async def fake_stdio_client(*args: Any, **kwargs: Any):
+            async with _mock_stdio_streams(inbound=list(msgs)) as (r, w):
+                yield r, w
+
+        with patch("mcp_proxy.adapters.stdio.stdio_client", fake_stdio_client):
+            async with StdioServerAdapter(command="fake", args=[]) as adapter:
+                first = await adapter.read_many(max_items=2)
+                second = await adapter.read_many(max_items=2)
+
+        assert [m.message for m in first] == [m.message for m in msgs[:2]]
+        assert [m.message for m in second] == [msgs[2].message]
+
 
 class TestStdioServerAdapterWrite:
     """Writing messages to the server via StdioServerAdapter."""
@@ -142,12 +195,63 @@ class TestStdioServerAdapterWrite:
         with patch("mcp_proxy.adapters.stdio.stdio_client", fake_stdio_client):
             async with StdioServerAdapter(command="fake", args=[]) as adapter:
                 await adapter.write(msg)
-                # Give writer task a chance to forward the message
-                await asyncio.sleep(0.05)
                 # Verify the message arrived on the receive end of the write stream
                 result = write_recv_ref[0].receive_nowait()
                 assert result.message == msg.message
 
+    async def test_write_many_sends_in_order(self) -> None:
+        """write_many() sends every message through to the SDK stream in order."""
+        msgs = [_make_session_message(msg_id=i) for i in range(3)]
+        write_recv_ref: list[Any] = []
+
+        @asynccontextmanager
+        async def fake_stdio_client(*args: Any, **kwargs: Any):
+            read_send, read_recv = anyio.create_memory_object_stream[SessionMessage | Exception](
+                max_buffer_size=16
+            )
+            write_send, write_recv = anyio.create_memory_object_stream[SessionMessage](
+                max_buffer_size=16
+            )
+            write_recv_ref.append(write_recv)
+            yield read_recv, write_send
+            read_send.close()
+            read_recv.close()
+            write_send.close()
+            write_recv.close()
+
+        with patch("mcp_proxy.adapters.stdio.stdio_client", fake_stdio_client):
+            async with StdioServerAdapter(command="fake", args=[]) as adapter:
+                await adapter.write_many(msgs)
+                sent = [write_recv_ref[0].receive_nowait() for _ in msgs]
+
+        assert [m.message for m in sent] == [m.message for m in msgs]
+
+    async def test_write_to_closed_stream_raises(self) -> None:
+        """write() raises RuntimeError when the SDK side has gone away."""
+        msg = _make_session_message()
+
+        @asynccontextmanager
+        async def fake_stdio_client(*args: Any, **kwargs: Any):
+            read_send, read_recv = anyio.create_memory_object_stream[SessionMessage | Exception](
+                max_buffer_size=16
+            )
+            write_send, write_recv = anyio.create_memory_object_stream[SessionMessage](
+                max_buffer_size=16
+            )
+            write_recv.close()
+            yield read_recv, write_send
+            read_send.close()
+            read_recv.close()
+            write_send.close()
+
+        with patch("mcp_proxy.adapters.stdio.stdio_client", fake_stdio_client):
+            async with StdioServerAdapter(command="fake", args=[]) as adapter:
+                try:
+                    await adapter.write(msg)
+                    raise AssertionError("Expected RuntimeError")  # noqa: TRY301
+                except RuntimeError:
+                    pass
+
 
 class TestStdioServerAdapterClose:
     """Lifecycle and close behavior for StdioServerAdapter."""
@@ -285,7 +389,6 @@ class TestStdioClientAdapterWrite:
         with patch("mcp_proxy.adapters.stdio.stdio_server", fake_stdio_server):
             async with StdioClientAdapter() as adapter:
                 await adapter.write(msg)
-                await asyncio.sleep(0.05)
                 result = write_recv_ref[0].receive_nowait()
                 assert result.message == msg.message
 
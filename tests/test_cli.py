@@ -3,15 +3,19 @@
 from __future__ import annotations
 
 import json
+import subprocess
+import sys
 import uuid
 from datetime import UTC, datetime
 from pathlib import Path
 
 from click.testing import CliRunner
+from mcp.shared.message import SessionMessage
 from mcp.types import JSONRPCMessage, JSONRPCRequest, JSONRPCResponse
 
-from mcp_proxy.cli import main
+from mcp_proxy.cli import _save_replay_results, main
 from mcp_proxy.models import Direction, ProxyMessage, Transport
+from mcp_proxy.replay import ReplayResult, ReplaySessionResult
 from mcp_proxy.session_store import SessionStore
 
 
@@ -82,6 +86,27 @@ def test_version():
     assert result.exit_code == 0
 
 
+def test_cli_import_does_not_load_sdk() -> None:
+    """Importing the CLI module does not pull in the MCP SDK or Textual."""
+    code = (
+        "import sys, mcp_proxy.cli; "
+        "print(any(m in sys.modules for m in ('mcp.types', 'textual.app')))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    assert out.strip() == "False"
+
+
+def test_uvloop_flag_without_uvloop_installed(monkeypatch) -> None:
+    """--uvloop fails with a usage error when uvloop is unavailable."""
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+    runner = CliRunner()
+    result = runner.invoke(main, ["--uvloop", "inspect", "--help"])
+    assert result.exit_code != 0
+    assert "perf" in result.output
+
+
 class TestProxyValidation:
     """proxy command validates transport/target combinations."""
 
@@ -164,6 +189,67 @@ class TestInspectCommand:
         assert '"jsonrpc"' in result.output
         assert '"tools/list"' in result.output
 
+    def test_inspect_verbose_prints_non_ascii_unescaped(self, tmp_path: Path) -> None:
+        """Verbose payloads show non-ASCII text as-is, not as \\u escapes."""
+        store = SessionStore(session_id="s1", transport=Transport.STDIO)
+        store.append(
+            ProxyMessage(
+                id=str(uuid.uuid4()),
+                sequence=0,
+                timestamp=datetime.now(tz=UTC),
+                direction=Direction.CLIENT_TO_SERVER,
+                transport=Transport.STDIO,
+                raw=JSONRPCMessage(
+                    JSONRPCRequest(
+                        jsonrpc="2.0", id=1, method="tools/call", params={"text": "héllo ✓"}
+                    )
+                ),
+                jsonrpc_id=1,
+                method="tools/call",
+                correlated_id=None,
+                modified=False,
+                original_raw=None,
+            )
+        )
+        session_file = tmp_path / "session.json"
+        store.save(session_file)
+
+        runner = CliRunner()
+        result = runner.invoke(main, ["inspect", "--session-file", str(session_file), "-v"])
+        assert result.exit_code == 0
+        assert '"text": "héllo ✓"' in result.output
+        assert "\\u00e9" not in result.output
+
+    def test_inspect_large_session_prints_every_message(self, tmp_path: Path) -> None:
+        """Output buffering still prints every message line, in order."""
+        store = SessionStore(session_id="big-session", transport=Transport.STDIO)
+        for i in range(600):
+            store.append(
+                ProxyMessage(
+                    id=str(uuid.uuid4()),
+                    sequence=i,
+                    timestamp=datetime.now(tz=UTC),
+                    direction=Direction.CLIENT_TO_SERVER,
+                    transport=Transport.STDIO,
+                    raw=JSONRPCMessage(JSONRPCRequest(jsonrpc="2.0", id=i, method="ping")),
+                    jsonrpc_id=i,
+                    method="ping",
+                    correlated_id=None,
+                    modified=False,
+                    original_raw=None,
+                )
+            )
+        session_file = tmp_path / "big.json"
+        store.save(session_file)
+
+        runner = CliRunner()
+        result = runner.invoke(main, ["inspect", "--session-file", str(session_file)])
+        assert result.exit_code == 0
+        message_lines = [line for line in result.output.splitlines() if " ping id=" in line]
+        assert len(message_lines) == 600
+        assert message_lines[0].startswith("  #000 ")
+        assert message_lines[-1].startswith("  #599 ")
+
     def test_inspect_missing_session_file(self, tmp_path: Path) -> None:
         runner = CliRunner()
         result = runner.invoke(
@@ -172,6 +258,55 @@ class TestInspectCommand:
         assert result.exit_code != 0
 
 
+class TestSaveReplayResults:
+    """_save_replay_results writes replay outcomes as JSON."""
+
+    def test_writes_results_json(self, tmp_path: Path) -> None:
+        store = _create_test_session(tmp_path / "session.json")
+        req, resp = store.get_messages()
+        response = SessionMessage(message=resp.raw)
+        session_result = ReplaySessionResult(
+            results=[
+                ReplayResult(
+                    original_request=req,
+                    sent_message=SessionMessage(message=req.raw),
+                    response=response,
+                    error=None,
+                    duration_ms=12.5,
+                ),
+                ReplayResult(
+                    original_request=req,
+                    sent_message=SessionMessage(message=req.raw),
+                    response=None,
+                    error="Timeout after 1.0s",
+                    duration_ms=1000.0,
+                ),
+            ],
+        )
+        output_path = tmp_path / "out" / "replay.json"
+
+        _save_replay_results(session_result, output_path, "python server.py")
+
+        data = json.loads(output_path.read_text(encoding="utf-8"))
+        assert data["target_command"] == "python server.py"
+        assert data["target_url"] is None
+        assert len(data["results"]) == 2
+        first, second = data["results"]
+        assert first["original_request"]["method"] == "tools/list"
+        assert first["sent_message"] == first["original_request"]
+        assert first["response"]["result"] == {"tools": []}
+        assert first["error"] is None
+        assert first["duration_ms"] == 12.5
+        assert second["response"] is None
+        assert second["error"] == "Timeout after 1.0s"
+
+    def test_writes_empty_results(self, tmp_path: Path) -> None:
+        output_path = tmp_path / "replay.json"
+        _save_replay_results(ReplaySessionResult(), output_path, None)
+        data = json.loads(output_path.read_text(encoding="utf-8"))
+        assert data == {"target_command": None, "target_url": None, "results": []}
+
+
 class TestReplayCommand:
     """replay command CLI tests."""
 
@@ -9,6 +9,8 @@ from mcp.types import (
 )
 
 from mcp_proxy.correlation import (
+    ClassifiedMessage,
+    classify,
     extract_jsonrpc_id,
     extract_method,
     is_notification,
@@ -95,3 +97,18 @@ class TestMessageClassification:
         assert is_request(msg) is False
         assert is_response(msg) is False
         assert is_notification(msg) is True
+
+
+class TestClassify:
+    def test_request(self) -> None:
+        assert classify(_request("tools/call", 3)) == ClassifiedMessage(3, "tools/call", "req")
+
+    def test_response(self) -> None:
+        assert classify(_response(4)) == ClassifiedMessage(4, None, "resp")
+
+    def test_error_is_response(self) -> None:
+        assert classify(_error(5)) == ClassifiedMessage(5, None, "resp")
+
+    def test_notification(self) -> None:
+        result = classify(_notification("notifications/progress"))
+        assert result == ClassifiedMessage(None, "notifications/progress", "notif")
@@ -89,6 +89,17 @@ class IntegrationClientAdapter:
             raise RuntimeError("IntegrationClientAdapter closed")
         return item
 
+    async def read_many(self, max_items: int = 32) -> list[SessionMessage]:
+        """Read the next message as a batch of one.
+
+        Args:
+            max_items: Upper bound on the batch size (unused).
+
+        Returns:
+            A single-item list with the next SessionMessage.
+        """
+        return [await self.read()]
+
     async def write(self, message: SessionMessage) -> None:
         """Store message for test inspection.
 
@@ -97,6 +108,15 @@ class IntegrationClientAdapter:
         """
         await self.write_queue.put(message)
 
+    async def write_many(self, messages: list[SessionMessage]) -> None:
+        """Store messages for test inspection, in order.
+
+        Args:
+            messages: The SessionMessages written by the pipeline.
+        """
+        for message in messages:
+            await self.write(message)
+
     async def close(self) -> None:
         """No-op — shutdown is handled explicitly via shutdown()."""
 
@@ -76,6 +76,14 @@ class TestHold:
         engine.hold(msg2)
         assert len(engine.get_held()) == 2
 
+    def test_get_held_reuses_snapshot_until_changed(self) -> None:
+        engine = InterceptEngine(mode=InterceptMode.INTERCEPT)
+        engine.hold(_make_proxy_message(sequence=1))
+        first = engine.get_held()
+        assert engine.get_held() is first
+        engine.hold(_make_proxy_message(sequence=2))
+        assert len(engine.get_held()) == 2
+
 
 class TestRelease:
     """InterceptEngine.release() sets action and fires event."""
@@ -110,6 +118,35 @@ class TestRelease:
         assert held.release.is_set()
         assert len(engine.get_held()) == 0
 
+    def test_release_one_keeps_others_in_hold_order(self) -> None:
+        engine = InterceptEngine(mode=InterceptMode.INTERCEPT)
+        held = [engine.hold(_make_proxy_message(sequence=i)) for i in range(3)]
+        engine.release(held[1], InterceptAction.FORWARD)
+        assert engine.get_held() == (held[0], held[2])
+
+    def test_release_twice_is_harmless(self) -> None:
+        engine = InterceptEngine(mode=InterceptMode.INTERCEPT)
+        held = engine.hold(_make_proxy_message())
+        engine.release(held, InterceptAction.FORWARD)
+        engine.release(held, InterceptAction.FORWARD)
+        assert engine.get_held() == ()
+
+
+class TestHeldLookup:
+    """InterceptEngine.held_count and get_held_by_id() track the held set."""
+
+    def test_count_and_lookup_follow_hold_and_release(self) -> None:
+        engine = InterceptEngine(mode=InterceptMode.INTERCEPT)
+        msg = _make_proxy_message()
+        assert engine.held_count == 0
+        assert engine.get_held_by_id(msg.id) is None
+        held = engine.hold(msg)
+        assert engine.held_count == 1
+        assert engine.get_held_by_id(msg.id) is held
+        engine.release(held, InterceptAction.FORWARD)
+        assert engine.held_count == 0
+        assert engine.get_held_by_id(msg.id) is None
+
 
 class TestSetMode:
     """InterceptEngine.set_mode() toggles and auto-releases."""
@@ -141,7 +178,7 @@ class TestGetState:
         engine = InterceptEngine(mode=InterceptMode.PASSTHROUGH)
         state = engine.get_state()
         assert state.mode == InterceptMode.PASSTHROUGH
-        assert state.held_messages == []
+        assert state.held_messages == ()
 
     def test_state_with_held_messages(self) -> None:
         engine = InterceptEngine(mode=InterceptMode.INTERCEPT)
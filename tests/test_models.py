@@ -169,7 +169,7 @@ class TestInterceptState:
     def test_default_passthrough(self) -> None:
         state = InterceptState(mode=InterceptMode.PASSTHROUGH)
         assert state.mode == InterceptMode.PASSTHROUGH
-        assert state.held_messages == []
+        assert state.held_messages == ()
 
     def test_with_held_messages(self) -> None:
         raw = _make_request()
@@ -194,7 +194,7 @@ class TestInterceptState:
         )
         state = InterceptState(
             mode=InterceptMode.INTERCEPT,
-            held_messages=[held],
+            held_messages=(held,),
         )
         assert state.mode == InterceptMode.INTERCEPT
         assert len(state.held_messages) == 1
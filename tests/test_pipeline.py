@@ -6,7 +6,7 @@ import asyncio
 import uuid
 from typing import Any
 
-from mcp.shared.message import SessionMessage
+from mcp.shared.message import ServerMessageMetadata, SessionMessage
 from mcp.types import (
     JSONRPCMessage,
     JSONRPCNotification,
@@ -23,7 +23,7 @@ from mcp_proxy.models import (
     ProxyMessage,
     Transport,
 )
-from mcp_proxy.pipeline import PipelineSession, run_pipeline
+from mcp_proxy.pipeline import PipelineSession, _remember_request, run_pipeline
 from mcp_proxy.session_store import SessionStore
 
 # ---------------------------------------------------------------------------
@@ -41,19 +41,39 @@ class MockAdapter:
     def __init__(self) -> None:
         self.read_queue: asyncio.Queue[SessionMessage | None] = asyncio.Queue()
         self.write_queue: asyncio.Queue[SessionMessage] = asyncio.Queue()
+        self.read_batches: list[int] = []
         self._closed = False
+        self._eof = False
 
     async def read(self) -> SessionMessage:
         """Return next message, or raise when None (signals close)."""
-        item = await self.read_queue.get()
+        item = None if self._eof else await self.read_queue.get()
         if item is None:
             raise Exception("Connection closed")
         return item
 
+    async def read_many(self, max_items: int = 32) -> list[SessionMessage]:
+        """Return next message plus any already queued; record batch sizes."""
+        batch = [await self.read()]
+        while len(batch) < max_items and not self.read_queue.empty():
+            item = self.read_queue.get_nowait()
+            if item is None:
+                # Close surfaces on the following read
+                self._eof = True
+                break
+            batch.append(item)
+        self.read_batches.append(len(batch))
+        return batch
+
     async def write(self, message: SessionMessage) -> None:
         """Store forwarded message for test inspection."""
         await self.write_queue.put(message)
 
+    async def write_many(self, messages: list[SessionMessage]) -> None:
+        """Store forwarded messages for test inspection."""
+        for message in messages:
+            await self.write(message)
+
     async def close(self) -> None:
         """Mark as closed."""
         self._closed = True
@@ -137,6 +157,19 @@ class TestClientToServerForwarding:
         assert fwd1.message.root.method == "tools/list"
         assert fwd2.message.root.method == "tools/call"
 
+    async def test_queued_burst_read_as_one_batch(self) -> None:
+        client = MockAdapter()
+        server = MockAdapter()
+        client.enqueue(*(_make_request("tools/call", msg_id=i) for i in range(3)))
+        server.enqueue()
+
+        session = _make_pipeline_session()
+        await run_pipeline(client, server, session)
+
+        assert client.read_batches == [3]
+        ids = [server.write_queue.get_nowait().message.root.id for _ in range(3)]
+        assert ids == [0, 1, 2]
+
 
 class TestServerToClientForwarding:
     """Messages from server adapter reach client adapter."""
@@ -223,6 +256,20 @@ class TestProxyMessageWrapping:
         assert len(client_msgs) == 2
         assert client_msgs[0].sequence < client_msgs[1].sequence
 
+    async def test_ids_unique_within_and_across_runs(self) -> None:
+        ids: list[str] = []
+        for _ in range(2):
+            client = MockAdapter()
+            server = MockAdapter()
+            client.enqueue(_make_request("tools/list", msg_id=1), _make_request("ping", msg_id=2))
+            server.enqueue()
+            session = _make_pipeline_session()
+            await run_pipeline(client, server, session)
+            for msg in session.session_store.get_messages():
+                assert msg.id.startswith(f"{msg.sequence:08x}-")
+                ids.append(msg.id)
+        assert len(set(ids)) == 4
+
 
 # ---------------------------------------------------------------------------
 # Tests: Correlation
@@ -262,6 +309,18 @@ class TestCorrelation:
         notif_msg = next(m for m in messages if m.method == "notifications/initialized")
         assert notif_msg.correlated_id is None
 
+    def test_unanswered_requests_bounded(self) -> None:
+        correlation_map: dict[str | int, str] = {}
+        for i in range(5):
+            _remember_request(correlation_map, i, f"proxy-{i}", limit=3)
+        assert correlation_map == {2: "proxy-2", 3: "proxy-3", 4: "proxy-4"}
+
+    def test_reused_id_becomes_newest(self) -> None:
+        correlation_map: dict[str | int, str] = {}
+        for msg_id, proxy_id in [(1, "a"), (2, "b"), (1, "c"), (3, "d")]:
+            _remember_request(correlation_map, msg_id, proxy_id, limit=2)
+        assert correlation_map == {1: "c", 3: "d"}
+
 
 # ---------------------------------------------------------------------------
 # Tests: Pipeline exits cleanly on adapter disconnect
@@ -324,6 +383,27 @@ class TestInterceptHoldAndForward:
         forwarded = server.write_queue.get_nowait()
         assert forwarded.message.root.method == "tools/list"
 
+    async def test_batch_flushed_before_hold(self) -> None:
+        """Messages ahead of a held message are forwarded before it waits."""
+        client = MockAdapter()
+        server = MockAdapter()
+        client.enqueue(_make_request("tools/list", msg_id=1), _make_request("tools/call", msg_id=2))
+        server.enqueue()
+
+        engine = InterceptEngine(mode=InterceptMode.INTERCEPT)
+        forwarded_at_hold: list[int] = []
+
+        def release_all(held: HeldMessage) -> None:
+            forwarded_at_hold.append(server.write_queue.qsize())
+            engine.release(held, InterceptAction.FORWARD)
+
+        session = _make_pipeline_session(intercept_engine=engine, on_held=release_all)
+        await run_pipeline(client, server, session)
+
+        assert client.read_batches == [2]
+        assert forwarded_at_hold == [0, 1]
+        assert server.write_queue.qsize() == 2
+
 
 class TestInterceptDrop:
     """Intercept mode drops messages when released with DROP."""
@@ -381,6 +461,27 @@ class TestInterceptModify:
         assert modified_msg.original_raw is not None
         assert modified_msg.raw == modified_raw
 
+    async def test_modified_message_keeps_transport_metadata(self) -> None:
+        client = MockAdapter()
+        server = MockAdapter()
+        metadata = ServerMessageMetadata(related_request_id=7)
+        req = SessionMessage(message=_make_request().message, metadata=metadata)
+        client.enqueue(req)
+        server.enqueue()
+
+        engine = InterceptEngine(mode=InterceptMode.INTERCEPT)
+        modified_raw = JSONRPCMessage(JSONRPCRequest(jsonrpc="2.0", id=1, method="tools/call"))
+
+        def modify_all(held: HeldMessage) -> None:
+            engine.release(held, InterceptAction.MODIFY, modified_raw=modified_raw)
+
+        session = _make_pipeline_session(intercept_engine=engine, on_held=modify_all)
+        await run_pipeline(client, server, session)
+
+        forwarded = server.write_queue.get_nowait()
+        assert forwarded.message is modified_raw
+        assert forwarded.metadata is metadata
+
 
 # ---------------------------------------------------------------------------
 # Tests: Callbacks
@@ -256,3 +256,78 @@ class TestReplayPreservesOrder:
             assert r.original_request is msgs[i]
             assert r.response is not None
             assert r.error is None
+
+
+class ReverseOrderAdapter(MockReplayAdapter):
+    """Answers only once ``batch`` requests are written, in reverse order.
+
+    A strictly sequential replay would time out on the first request.
+    """
+
+    def __init__(self, batch: int, skip_ids: tuple[int, ...] = ()) -> None:
+        super().__init__()
+        self._batch = batch
+        self._skip_ids = skip_ids
+        self._request_ids: list[int] = []
+
+    async def write(self, message: SessionMessage) -> None:
+        await super().write(message)
+        root = message.message.root
+        if isinstance(root, JSONRPCRequest):
+            self._request_ids.append(int(root.id))
+        if len(self._request_ids) == self._batch:
+            for msg_id in reversed(self._request_ids):
+                if msg_id not in self._skip_ids:
+                    self.enqueue_response(msg_id, {"id": msg_id})
+            self._request_ids.clear()
+
+
+class TestReplayWindowed:
+    """max_in_flight > 1 keeps several requests outstanding."""
+
+    async def test_out_of_order_responses_matched_by_id(self) -> None:
+        adapter = ReverseOrderAdapter(batch=3)
+        msgs = [
+            _make_proxy_message(method="tools/call", msg_id=i, sequence=i)
+            for i in range(1, 4)
+        ]
+        results = await replay_messages(
+            msgs, adapter, timeout=2.0, auto_handshake=False, max_in_flight=3
+        )
+
+        assert [r.original_request for r in results] == msgs
+        for msg, r in zip(msgs, results, strict=True):
+            assert r.error is None
+            assert r.response is not None
+            assert r.response.message.root.id == msg.jsonrpc_id
+        assert [m.message.root.id for m in adapter.written] == [1, 2, 3]
+
+    async def test_unanswered_request_times_out_alone(self) -> None:
+        adapter = ReverseOrderAdapter(batch=2, skip_ids=(1,))
+        msgs = [
+            _make_proxy_message(method="tools/call", msg_id=1, sequence=0),
+            _make_proxy_message(method="tools/call", msg_id=2, sequence=1),
+        ]
+        results = await replay_messages(
+            msgs, adapter, timeout=0.2, auto_handshake=False, max_in_flight=2
+        )
+
+        assert results[0].response is None
+        assert results[0].error is not None
+        assert "Timeout" in results[0].error
+        assert results[1].response is not None
+        assert results[1].error is None
+
+    async def test_notification_not_awaited(self) -> None:
+        adapter = ReverseOrderAdapter(batch=1)
+        msgs = [
+            _make_proxy_message(method="notifications/initialized", msg_id=None, sequence=0),
+            _make_proxy_message(method="tools/list", msg_id=1, sequence=1),
+        ]
+        results = await replay_messages(
+            msgs, adapter, timeout=2.0, auto_handshake=False, max_in_flight=4
+        )
+
+        assert results[0].response is None
+        assert results[0].error is None
+        assert results[1].response is not None
@@ -207,3 +207,125 @@ class TestSaveLoad:
         file_path = tmp_path / "subdir" / "session.json"
         store.save(file_path)
         assert file_path.exists()
+
+    def test_save_matches_proxy_session_json(self, tmp_path: Path) -> None:
+        """Streamed save writes the same bytes as dumping the whole ProxySession."""
+        for count in (0, 3):
+            store = SessionStore(
+                session_id="s1",
+                transport=Transport.STDIO,
+                server_url="http://localhost:8080",
+                metadata={"note": "ünïcode", "tags": ["a", "b"], "limit": 2**70},
+            )
+            for i in range(count):
+                store.append(_make_proxy_message(msg_id=i, sequence=i))
+            if count:
+                # Integers past 64 bits, nested params and a modified entry
+                big = 123456789012345678901234567890
+                msg = _make_proxy_message(method="tools/call", msg_id=big, sequence=count)
+                msg.original_raw = msg.raw
+                msg.raw = JSONRPCMessage(
+                    JSONRPCRequest(
+                        jsonrpc="2.0",
+                        id=big,
+                        method="tools/call",
+                        params={"name": "add", "arguments": {"a": big, "b": [], "c": {}}},
+                    )
+                )
+                msg.modified = True
+                store.append(msg)
+            file_path = tmp_path / f"session-{count}.json"
+            store.save(file_path)
+            expected = store.to_proxy_session().model_dump_json(indent=2)
+            assert file_path.read_text(encoding="utf-8") == expected
+
+    def test_load_keeps_big_integers_exact(self, tmp_path: Path) -> None:
+        """Integers wider than 64 bits survive a save/load round trip."""
+        big = 123456789012345678901234567890
+        store = SessionStore(session_id="s1", transport=Transport.STDIO, metadata={"run": big})
+        msg = _make_proxy_message(method="tools/call", msg_id=big)
+        msg.raw = JSONRPCMessage(
+            JSONRPCRequest(
+                jsonrpc="2.0", id=big, method="tools/call", params={"arguments": {"n": big}}
+            )
+        )
+        store.append(msg)
+        file_path = tmp_path / "session.json"
+        store.save(file_path)
+
+        loaded = SessionStore.load(file_path)
+        assert loaded.metadata == {"run": big}
+        [saved] = loaded.get_messages()
+        assert saved.jsonrpc_id == big
+        assert saved.raw.root.id == big
+        assert saved.raw.root.params == {"arguments": {"n": big}}
+
+    def test_save_keeps_no_encoded_entries(self, tmp_path: Path) -> None:
+        """One-off saves do not hold encoded entries after writing."""
+        store = SessionStore(session_id="s1", transport=Transport.STDIO)
+        store.append(_make_proxy_message())
+        store.save(tmp_path / "session.json")
+        assert store._encoded == {}
+
+    async def test_resave_reflects_modified_message(self, tmp_path: Path) -> None:
+        """A message modified after an earlier save is re-serialized."""
+        store = SessionStore(session_id="s1", transport=Transport.STDIO)
+        msg = _make_proxy_message(method="tools/list", msg_id=1)
+        store.append(msg)
+        await store.save_async(tmp_path / "first.json")
+        assert msg.id in store._encoded
+
+        msg.original_raw = msg.raw
+        msg.raw = JSONRPCMessage(JSONRPCRequest(jsonrpc="2.0", id=1, method="tools/call"))
+        msg.modified = True
+        store.append(_make_proxy_message(method="ping", msg_id=2, sequence=2))
+        file_path = tmp_path / "second.json"
+        await store.save_async(file_path)
+
+        assert file_path.read_text(encoding="utf-8") == (
+            store.to_proxy_session().model_dump_json(indent=2)
+        )
+        loaded = SessionStore.load(file_path).get_messages()
+        assert loaded[0].raw.root.method == "tools/call"
+        assert loaded[0].modified is True
+        assert loaded[1].method == "ping"
+
+    async def test_resave_after_partial_modify(self, tmp_path: Path) -> None:
+        """A save between the raw swap and the modified flag is not cached stale."""
+        store = SessionStore(session_id="s1", transport=Transport.STDIO)
+        msg = _make_proxy_message(method="tools/list", msg_id=1)
+        store.append(msg)
+        msg.original_raw = msg.raw
+        msg.raw = JSONRPCMessage(JSONRPCRequest(jsonrpc="2.0", id=1, method="tools/call"))
+        await store.save_async(tmp_path / "first.json")
+
+        msg.modified = True
+        file_path = tmp_path / "second.json"
+        await store.save_async(file_path)
+
+        assert SessionStore.load(file_path).get_messages()[0].modified is True
+
+    async def test_save_async_writes_snapshot(self, tmp_path: Path) -> None:
+        """Messages changed while the save thread runs keep their saved state."""
+        store = SessionStore(session_id="s1", transport=Transport.STDIO)
+        msg = _make_proxy_message(method="tools/list", msg_id=1)
+        store.append(msg)
+        write = store._write
+
+        def mutate_then_write(*args: object) -> None:
+            msg.raw = JSONRPCMessage(JSONRPCRequest(jsonrpc="2.0", id=1, method="tools/call"))
+            write(*args)
+
+        store._write = mutate_then_write  # type: ignore[method-assign]
+        file_path = tmp_path / "session.json"
+        await store.save_async(file_path)
+
+        saved = SessionStore.load(file_path).get_messages()[0]
+        assert saved.raw.root.method == "tools/list"
+
+    async def test_save_async_matches_save(self, tmp_path: Path) -> None:
+        store = SessionStore(session_id="s1", transport=Transport.STDIO)
+        store.append(_make_proxy_message(method="tools/list", msg_id=1))
+        store.save(tmp_path / "sync.json")
+        await store.save_async(tmp_path / "async.json")
+        assert (tmp_path / "async.json").read_bytes() == (tmp_path / "sync.json").read_bytes()
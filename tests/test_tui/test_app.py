@@ -11,16 +11,18 @@ from mcp.shared.message import SessionMessage
 from mcp.types import JSONRPCMessage, JSONRPCRequest
 from textual.widgets import RichLog
 
-from mcp_proxy.models import Direction, HeldMessage, ProxyMessage, Transport
+from mcp_proxy.models import Direction, InterceptMode, ProxyMessage, Transport
 from mcp_proxy.tui.app import ProxyApp
 from mcp_proxy.tui.messages import (
+    MessageForwarded,
     MessageHeld,
     MessageReceived,
+    MessagesReceived,
     PipelineError,
     PipelineStopped,
 )
 from mcp_proxy.tui.widgets.message_detail import MessageDetailPanel
-from mcp_proxy.tui.widgets.message_list import MessageListPanel
+from mcp_proxy.tui.widgets.message_list import MessageListPanel, MessageSelected
 from mcp_proxy.tui.widgets.status_bar import ProxyStatusBar
 
 # ---------------------------------------------------------------------------
@@ -44,15 +46,6 @@ def _make_proxy_message(method: str = "tools/list", seq: int = 0, msg_id: int =
     )
 
 
-def _make_held_message(pm: ProxyMessage) -> HeldMessage:
-    return HeldMessage(
-        proxy_message=pm,
-        release=asyncio.Event(),
-        action=None,
-        modified_raw=None,
-    )
-
-
 class MockAdapter:
     """Minimal mock adapter for TUI tests."""
 
@@ -66,9 +59,16 @@ class MockAdapter:
             raise Exception("Connection closed")
         return item
 
+    async def read_many(self, max_items: int = 32) -> list[SessionMessage]:
+        return [await self.read()]
+
     async def write(self, message: SessionMessage) -> None:
         await self.write_queue.put(message)
 
+    async def write_many(self, messages: list[SessionMessage]) -> None:
+        for message in messages:
+            await self.write(message)
+
     async def close(self) -> None:
         pass
 
@@ -144,6 +144,74 @@ class TestMessageEventHandling:
             bar = app.query_one(ProxyStatusBar)
             assert bar.message_count == 2
 
+    async def test_pipeline_burst_posts_one_batch(self) -> None:
+        app = ProxyApp(
+            transport=Transport.STDIO,
+            server_command="echo hello",
+            run_pipeline_on_mount=False,
+        )
+        async with app.run_test() as pilot:
+            posted: list[object] = []
+            original_post = app.post_message
+
+            def record(message: object) -> bool:
+                posted.append(message)
+                return original_post(message)  # type: ignore[arg-type]
+
+            app.post_message = record  # type: ignore[method-assign]
+            burst = [_make_proxy_message("tools/call", seq=i) for i in range(3)]
+            for pm in burst:
+                app._on_pipeline_message(pm)
+            await pilot.pause()
+            app._on_pipeline_message(_make_proxy_message("ping", seq=3))
+            await pilot.pause()
+
+            batches = [m for m in posted if isinstance(m, MessagesReceived)]
+            assert [len(m.proxy_messages) for m in batches] == [3, 1]
+            panel = app.query_one(MessageListPanel)
+            assert [pm.sequence for pm in panel.messages] == [0, 1, 2, 3]
+            assert app.query_one(ProxyStatusBar).message_count == 4
+
+    async def test_pipeline_message_after_rejected_post_is_shown(self) -> None:
+        app = ProxyApp(
+            transport=Transport.STDIO,
+            server_command="echo hello",
+            run_pipeline_on_mount=False,
+        )
+        async with app.run_test() as pilot:
+            original_post = app.post_message
+            app.post_message = lambda message: False  # type: ignore[method-assign]
+            app._on_pipeline_message(_make_proxy_message("tools/call", seq=0))
+            app.post_message = original_post  # type: ignore[method-assign]
+            app._on_pipeline_message(_make_proxy_message("ping", seq=1))
+            await pilot.pause()
+
+            panel = app.query_one(MessageListPanel)
+            assert [pm.sequence for pm in panel.messages] == [1]
+
+    async def test_passthrough_forwarding_posts_no_forwarded_events(self) -> None:
+        app = ProxyApp(
+            transport=Transport.STDIO,
+            server_command="echo hello",
+            run_pipeline_on_mount=False,
+        )
+        async with app.run_test() as pilot:
+            posted: list[object] = []
+            original_post = app.post_message
+
+            def record(message: object) -> bool:
+                posted.append(message)
+                return original_post(message)  # type: ignore[arg-type]
+
+            app.post_message = record  # type: ignore[method-assign]
+            app._on_pipeline_forwarded(_make_proxy_message())
+            app.intercept_engine.set_mode(InterceptMode.INTERCEPT)
+            app._on_pipeline_forwarded(_make_proxy_message())
+            await pilot.pause()
+
+            forwarded = [m for m in posted if isinstance(m, MessageForwarded)]
+            assert len(forwarded) == 1
+
     async def test_message_held_updates_status(self) -> None:
         app = ProxyApp(
             transport=Transport.STDIO,
@@ -152,9 +220,8 @@ class TestMessageEventHandling:
         )
         async with app.run_test() as pilot:
             pm = _make_proxy_message("tools/call", seq=0)
-            held = _make_held_message(pm)
-            # Manually add to intercept engine's held list for counting
-            app.intercept_engine._held.append(held)
+            # Hold through the engine so the status bar count sees it
+            held = app.intercept_engine.hold(pm)
             app.post_message(MessageHeld(held))
             await pilot.pause()
             bar = app.query_one(ProxyStatusBar)
@@ -213,6 +280,49 @@ class TestSelection:
             text = "\n".join(str(line) for line in log.lines)
             assert "tools/call" in text
 
+    async def test_rapid_selection_renders_latest(self) -> None:
+        app = ProxyApp(
+            transport=Transport.STDIO,
+            server_command="echo hello",
+            run_pipeline_on_mount=False,
+        )
+        async with app.run_test() as pilot:
+            messages = [_make_proxy_message(f"tools/m{i}", seq=i) for i in range(3)]
+            rendered: list[str | None] = []
+            detail = app.query_one(MessageDetailPanel)
+            original_show = detail.show_message
+
+            def record(pm: ProxyMessage) -> None:
+                rendered.append(pm.method)
+                original_show(pm)
+
+            detail.show_message = record  # type: ignore[method-assign]
+            for pm in messages:
+                app.post_message(MessageSelected(pm))
+            await pilot.pause(delay=0.2)
+            # The middle selection was superseded before its turn to render
+            assert rendered == ["tools/m0", "tools/m2"]
+
+
+class TestFilterInput:
+    """Typing in the filter input re-applies the filter once typing pauses."""
+
+    async def test_typing_burst_applies_filter_once(self) -> None:
+        app = ProxyApp(
+            transport=Transport.STDIO,
+            server_command="echo hello",
+            run_pipeline_on_mount=False,
+        )
+        async with app.run_test() as pilot:
+            panel = app.query_one(MessageListPanel)
+            applied: list[str] = []
+            panel.set_filter = applied.append  # type: ignore[method-assign]
+
+            await pilot.press("/", "t", "o", "o", "l")
+            await pilot.pause(delay=0.3)
+
+            assert applied == ["tool"]
+
 
 # ---------------------------------------------------------------------------
 # Tests: Key bindings
@@ -219,6 +219,25 @@ class TestModify:
             assert not detail.is_editing
             assert not app._editing
 
+    async def test_modify_confirm_rejects_invalid_json(self) -> None:
+        app = _make_app(intercept=True)
+        async with app.run_test() as pilot:
+            pm = _make_proxy_message("tools/list", seq=0, msg_id=1)
+            held = await _add_and_hold(app, pilot, pm)
+
+            await pilot.press("m")
+            detail = app.query_one(MessageDetailPanel)
+            editor = detail.query_one("#detail-editor", TextArea)
+            editor.text = '{"jsonrpc": "2.0", "id": 1,'
+            await pilot.pause()
+
+            await pilot.press("ctrl+s")
+
+            assert held.action is None
+            assert not held.release.is_set()
+            assert detail.is_editing
+            assert app._editing
+
     async def test_modify_cancel(self) -> None:
         app = _make_app(intercept=True)
         async with app.run_test() as pilot:
@@ -298,7 +317,7 @@ class TestSaveSession:
             await pilot.pause()
 
             await pilot.press("s")
-            await pilot.pause()
+            await app.workers.wait_for_complete()
 
             assert save_path.exists()
             content = json.loads(save_path.read_text(encoding="utf-8"))
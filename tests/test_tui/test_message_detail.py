@@ -8,7 +8,7 @@ from datetime import UTC, datetime
 from mcp.shared.message import SessionMessage
 from mcp.types import JSONRPCMessage, JSONRPCRequest, JSONRPCResponse
 from textual.app import App, ComposeResult
-from textual.widgets import RichLog
+from textual.widgets import RichLog, TextArea
 
 from mcp_proxy.models import Direction, ProxyMessage, Transport
 from mcp_proxy.replay import ReplayResult
@@ -72,6 +72,60 @@ class TestMessageDetailPanel:
             assert "#3" in text
             assert "CLIENT_TO_SERVER" in text or "client_to_server" in text
 
+    async def test_edit_mode_text_is_indented_json(self) -> None:
+        app = DetailTestApp()
+        async with app.run_test() as pilot:
+            panel = app.query_one(MessageDetailPanel)
+            pm = _make_proxy_message("tools/call", msg_id=7)
+            panel.enter_edit_mode(pm)
+            await pilot.pause()
+            assert panel.get_edited_text() == (
+                '{\n  "method": "tools/call",\n  "jsonrpc": "2.0",\n  "id": 7\n}'
+            )
+
+    async def test_show_message_with_big_integer(self) -> None:
+        app = DetailTestApp()
+        async with app.run_test() as pilot:
+            panel = app.query_one(MessageDetailPanel)
+            pm = _make_proxy_message("tools/call")
+            pm.raw = JSONRPCMessage(
+                JSONRPCRequest(
+                    jsonrpc="2.0",
+                    id=1,
+                    method="tools/call",
+                    params={"arguments": {"n": 123456789012345678901234567890}},
+                )
+            )
+            panel.show_message(pm)
+            panel.enter_edit_mode(pm)
+            await pilot.pause()
+            assert '"n": 123456789012345678901234567890' in panel.get_edited_text()
+
+    async def test_edit_after_show_reuses_formatted_payload(self) -> None:
+        app = DetailTestApp()
+        async with app.run_test() as pilot:
+            panel = app.query_one(MessageDetailPanel)
+            pm = _make_proxy_message("tools/call", msg_id=7)
+            panel.show_message(pm)
+            shown = panel._formatted
+            panel.enter_edit_mode(pm)
+            await pilot.pause()
+            assert panel._formatted is shown
+            assert '"method": "tools/call"' in panel.get_edited_text()
+
+    async def test_reopening_edit_mode_discards_abandoned_edits(self) -> None:
+        app = DetailTestApp()
+        async with app.run_test() as pilot:
+            panel = app.query_one(MessageDetailPanel)
+            pm = _make_proxy_message("tools/call", msg_id=7)
+            panel.enter_edit_mode(pm)
+            original = panel.get_edited_text()
+            panel.query_one("#detail-editor", TextArea).text = "{}"
+            panel.exit_edit_mode()
+            panel.enter_edit_mode(pm)
+            await pilot.pause()
+            assert panel.get_edited_text() == original
+
     async def test_clear_resets_panel(self) -> None:
         app = DetailTestApp()
         async with app.run_test() as pilot:
@@ -123,6 +123,21 @@ class TestMatchesFilter:
             )
             assert panel._matches_filter(pm, "file_search") is True
 
+    async def test_matches_filter_payload_after_modify(self) -> None:
+        """A modified payload is searched, not the one seen by an earlier filter."""
+        app = FilterTestApp()
+        async with app.run_test():
+            panel = app.query_one(MessageListPanel)
+            pm = _make_proxy_message("tools/call", params={"name": "file_search"})
+            assert panel._matches_filter(pm, "file_search") is True
+            pm.raw = JSONRPCMessage(
+                JSONRPCRequest(
+                    jsonrpc="2.0", id=1, method="tools/call", params={"name": "file_delete"}
+                )
+            )
+            assert panel._matches_filter(pm, "file_search") is False
+            assert panel._matches_filter(pm, "file_delete") is True
+
     async def test_matches_filter_case_insensitive(self) -> None:
         """Filter matching is case-insensitive."""
         app = FilterTestApp()